@@ -14,6 +14,8 @@ class CacheEvent(Enum):
     EVICTION = "eviction"
     UPDATE = "update"
 
+_REQUEST_EVENTS = frozenset((CacheEvent.HIT, CacheEvent.MISS))
+
 class MBTACacheManager:
     """
     Manages caching with expiration policies for server-side cache.
@@ -73,7 +75,7 @@ class MBTACacheManager:
     def get_cached_data(
         self, path: str, 
         params: Optional[Dict[str, Any]]
-    ) -> Tuple[Optional[Any], Optional[float], Optional[str]]:
+    ) -> Tuple[Optional[Any], Optional[int], Optional[str]]:
         """Retrieve cached data from the server-side cache."""
         try:
             key = self.generate_cache_key(path, params)
@@ -91,11 +93,12 @@ class MBTACacheManager:
         params: Optional[Dict[str, Any]],
         data: Any,
         last_modified: Optional[str] = None
-    ) -> float:
+    ) -> int:
         """Update the server-side cache with data."""
         try:
             key = self.generate_cache_key(path, params)
-            timestamp = int(time.time())
+            # nanoseconds, two updates within the same second still get increasing timestamps
+            timestamp = time.time_ns()
             self._cache[key] = {
                 "data": data,
                 "timestamp": timestamp,
@@ -108,7 +111,7 @@ class MBTACacheManager:
         
         except Exception as e:
             self._logger.error("Error updating cache: %s", e, exc_info=True)
-            return 0.0
+            return 0
 
 class MBTACacheManagerStats:
 
@@ -145,7 +148,7 @@ class MBTACacheManagerStats:
                 self._evictions += 1
                 self._entries = max(0, self._entries - 1)
 
-            if cache_event in [CacheEvent.HIT, CacheEvent.MISS] and self._requests > 0 and self._requests % self.requests_per_stats_report == 0:
+            if cache_event in _REQUEST_EVENTS and self._requests > 0 and self._requests % self.requests_per_stats_report == 0:
                 self.print_stats()
         except Exception as e:
             self._logger.error("Error increasing counter for event %s: %s", cache_event, e, exc_info=True)
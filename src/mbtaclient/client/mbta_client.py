@@ -9,6 +9,7 @@ from ..models.mbta_schedule import MBTASchedule
 from ..models.mbta_prediction import MBTAPrediction
 from ..models.mbta_trip import MBTATrip
 from ..models.mbta_alert import MBTAAlert
+from ..mbta_object_store import MBTARouteObjStore, MBTATripObjStore
 from .mbta_cache_manager import MBTACacheManager, CacheEvent
 from .mbta_session_manager import MBTASessionManager, MBTASessionManagerContext
 
@@ -76,7 +77,7 @@ class MBTAClient:
 
     async def _fetch_data(
         self, path: str, params: Optional[Dict[str, Any]] = None
-    ) -> Tuple[Dict[str, Any], float]:
+    ) -> Tuple[Dict[str, Any], int]:
         """Helper method to fetch data from the MBTA API."""
         try:
             data, timestamp = await self.request("GET", path, params)
@@ -97,7 +98,7 @@ class MBTAClient:
             self._logger.error("Unexpected error: %s", error, exc_info=True)
             raise
 
-    async def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, float]:
+    async def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, int]:
         """Make an HTTP request with optional query parameters."""
         params = params or {}
         headers = {}
@@ -153,7 +154,8 @@ class MBTAClient:
                 )
             if self._cache_manager.cache_stats:
                 self._cache_manager.cache_stats.increase_counter(CacheEvent.MISS)
-            return data, timestamp
+            # 0 when the response cannot be timestamped (no Last-Modified and nothing cached)
+            return data, timestamp or 0
 
         except MBTAAuthenticationError as error:
             self._logger.error("Authentication failed: %s", error)
@@ -172,72 +174,82 @@ class MBTAClient:
             self._logger.error("Unexpected error during request to %s: %s", url or "Unknown URL", error)
             raise MBTAClientError("Unexpected error during request.", url=url or "Unknown URL") from error
 
-    async def fetch_route(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTARoute, float]:
+    async def fetch_route(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTARoute, int]:
         """Fetch a MBTARoute by its ID."""
         self._logger.debug(f"Fetching MBTA route with ID: {id}")
         data, timestamp = await self._fetch_data(f"{ENDPOINTS['ROUTES']}/{id}", params)
         return MBTARoute(data["data"]), timestamp
 
-    async def fetch_trip(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTATrip, float]:
+    async def fetch_trip(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTATrip, int]:
         """Fetch a MBTATrip by its ID."""
         self._logger.debug(f"Fetching MBTA trip with ID: {id}")
         data, timestamp = await self._fetch_data(f"{ENDPOINTS['TRIPS']}/{id}", params)
         return MBTATrip(data["data"]), timestamp
     
-    async def fetch_stop(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTAStop, float]:
+    async def fetch_stop(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTAStop, int]:
         """Fetch a MBTAStop by its ID."""
         self._logger.debug(f"Fetching MBTA stop with ID: {id}")
         data, timestamp = await self._fetch_data(f'{ENDPOINTS["STOPS"]}/{id}', params)
         return MBTAStop(data['data']), timestamp
     
-    async def fetch_vehicle(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTAVehicle, float]:
+    async def fetch_vehicle(self, id: str, params: Optional[Dict[str, Any]] = None) -> Tuple[MBTAVehicle, int]:
         """Fetch a MBTAVehicle by its ID."""
         self._logger.debug("Fetching MBTA vehicle with ID: {id}")
         data, timestamp = await self._fetch_data(ENDPOINTS['VEHICLES']/{id}, params)
         return MBTAVehicle(data['data']), timestamp
 
-    async def fetch_routes(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTARoute], float]:
+    async def fetch_routes(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTARoute], int]:
         """Fetch a list of MBTARoute."""
         self._logger.debug("Fetching all MBTA routes")
         data, timestamp = await self._fetch_data(ENDPOINTS["ROUTES"], params)
         return [MBTARoute(item) for item in data["data"]], timestamp
 
-    async def fetch_trips(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTATrip], float]:
+    async def fetch_trips(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTATrip], int]:
         """Fetch a list of MBTATrip."""
         self._logger.debug("Fetching MBTA trips")
         data, timestamp = await self._fetch_data(ENDPOINTS["TRIPS"], params)
         return [MBTATrip(item) for item in data["data"]], timestamp
 
-    async def fetch_stops(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAStop], float]:
+    async def fetch_stops(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAStop], int]:
         """Fetch a list of MBTAStops."""
         self._logger.debug("Fetching MBTA stops")
         data, timestamp = await self._fetch_data(ENDPOINTS['STOPS'], params)
         return [MBTAStop(item) for item in data["data"]], timestamp
 
-    async def fetch_schedules(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTASchedule], float]:
+    async def fetch_schedules(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTASchedule], int]:
         """Fetch a list of MBTASchedules."""
         self._logger.debug("Fetching MBTA schedules")
         data, timestamp = await self._fetch_data(ENDPOINTS['SCHEDULES'], params)
+        self._store_included(data)
         return [MBTASchedule(item) for item in data["data"]], timestamp
 
-    async def fetch_vehicles(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAVehicle], float]:
+    async def fetch_vehicles(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAVehicle], int]:
         """Fetch a list of MBTAAlerts."""
         self._logger.debug("Fetching MBTA vehicles")
         data, timestamp = await self._fetch_data(ENDPOINTS['VEHICLES'], params)
         return [MBTAVehicle(item) for item in data["data"]], timestamp
 
-    async def fetch_predictions(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAPrediction], float]:
+    async def fetch_predictions(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAPrediction], int]:
         """Fetch a list of MBTAPredictions."""
         self._logger.debug("Fetching MBTA predictions")
         data, timestamp = await self._fetch_data(ENDPOINTS['PREDICTIONS'], params)
+        self._store_included(data)
         return [MBTAPrediction(item) for item in data["data"]], timestamp
 
-    async def fetch_alerts(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAAlert], float]:
+    async def fetch_alerts(self, params: Optional[Dict[str, Any]] = None) -> Tuple[list[MBTAAlert], int]:
         """Fetch a list of MBTAAlerts."""
         self._logger.debug("Fetching MBTA alerts")
         data, timestamp = await self._fetch_data(ENDPOINTS['ALERTS'], params)
         return [MBTAAlert(item) for item in data["data"]], timestamp
 
+    def _store_included(self, data: Dict[str, Any]) -> None:
+        """Store the routes and trips side-loaded with `include` in the object stores."""
+        for item in data.get("included", []):
+            if item.get("type") == "route":
+                MBTARouteObjStore.store(MBTARoute(item))
+            elif item.get("type") == "trip":
+                MBTATripObjStore.store(MBTATrip(item))
+
 class MBTAAuthenticationError(Exception):
     """Custom exception for MBTA authentication errors."""
 
@@ -1,9 +1,10 @@
 import asyncio
 import logging
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from abc import abstractmethod
 import traceback
+from itertools import islice
 from typing import Optional, Tuple, Union
 
 
@@ -20,6 +21,13 @@ from ..models.mbta_schedule import MBTASchedule
 from ..models.mbta_prediction import MBTAPrediction, MBTAScheduleRelationship
 from ..models.mbta_alert import MBTAAlert, MBTAAlertPassengerActivity, MBTAAlertsInformedEntity
 
+_SUBWAY_ROUTE_TYPES = frozenset((0, 1))  # light rail + heavy rail
+_DROPPED_SCHEDULE_RELATIONSHIPS = frozenset((
+    MBTAScheduleRelationship.CANCELLED.value,
+    MBTAScheduleRelationship.SKIPPED.value,
+    MBTAScheduleRelationship.NO_DATA.value,
+))
+
 class MBTABaseHandler:
 
     DEFAULT_MAX_TRIPS = 1
@@ -78,7 +86,7 @@ class MBTABaseHandler:
             self._logger.error(f"Error updating MBTA stops: {e}")
             raise
 
-    async def __fetch_mbta_stops(self, params: dict = None) -> Tuple[list[MBTAStop],float]:
+    async def __fetch_mbta_stops(self, params: dict = None) -> Tuple[list[MBTAStop],int]:
         base_params = {
             'filter[location_type]': '0'
             }
@@ -96,13 +104,20 @@ class MBTABaseHandler:
         departure_stop_name: Optional[str],
         arrival_stop_name: Optional[str]) -> None:
 
+        departure_name = departure_stop_name.lower() if departure_stop_name else None
+        arrival_name = arrival_stop_name.lower() if arrival_stop_name else None
+        store = MBTAStopObjStore.store
+        departure_stops_ids = self._mbta_stops_ids[StopType.DEPARTURE]
+        arrival_stops_ids = self._mbta_stops_ids[StopType.ARRIVAL]
+
         for mbta_stop in mbta_stops:
-            if departure_stop_name and departure_stop_name.lower() == mbta_stop.name.lower() :
-                MBTAStopObjStore.store(mbta_stop)
-                self._mbta_stops_ids[StopType.DEPARTURE].append(mbta_stop.id)
-            if arrival_stop_name and arrival_stop_name.lower() == mbta_stop.name.lower():
-                MBTAStopObjStore.store(mbta_stop)
-                self._mbta_stops_ids[StopType.ARRIVAL].append(mbta_stop.id)
+            mbta_stop_name = mbta_stop.name.lower()
+            if departure_name and departure_name == mbta_stop_name:
+                store(mbta_stop)
+                departure_stops_ids.append(mbta_stop.id)
+            if arrival_name and arrival_name == mbta_stop_name:
+                store(mbta_stop)
+                arrival_stops_ids.append(mbta_stop.id)
 
         if departure_stop_name and len(self._mbta_stops_ids[StopType.DEPARTURE]) == 0:
             self._logger.error(f"Invalid departure stop name, no MBTA stop name matching {departure_stop_name} ")
@@ -145,9 +160,9 @@ class MBTABaseHandler:
             mbta_schedules, timestamp = await task_schedules
             
             ## UGLY! using improperly the cache manager to store processed schedule, 
-            cached_data, _, cached_timestamp = self._cache_manager.get_cached_data(path=params,params=None)
+            cached_data, _, last_processed_timestamp = self._cache_manager.get_cached_data(path=params,params=None)
             
-            if cached_timestamp == timestamp:
+            if cached_data is not None and not self._should_reprocess(last_processed_timestamp, timestamp):
                 self._logger.debug("MBTA schedules data are up-to-date. Skipp processing.")
                 trips = cached_data
             else:
@@ -175,9 +190,14 @@ class MBTABaseHandler:
             self._logger.error(f"Error updating scheduling: {e}")
             raise
 
+    @staticmethod
+    def _should_reprocess(last_processed_timestamp: Optional[int], timestamp: int) -> bool:
+        """Return True if data fetched at `timestamp` (int epoch nanoseconds) is newer than the last processed."""
+        return not timestamp or (last_processed_timestamp or 0) < timestamp
+
     async def __fetch_schedules(
         self,
-        params: Optional[dict] = None) -> Tuple[list[MBTASchedule],float]:
+        params: Optional[dict] = None) -> Tuple[list[MBTASchedule],int]:
 
         base_params = {
             'filter[stop]': ','.join(
@@ -185,6 +205,7 @@ class MBTABaseHandler:
                 self._mbta_stops_ids.get(StopType.ARRIVAL, [])
             ),
             'sort': 'departure_time',
+            'include': 'trip,route'
         }
 
         if params is not None:
@@ -195,7 +216,7 @@ class MBTABaseHandler:
 
     async def __fetch_predictions(
         self,
-        params: Optional[dict] = None) -> Tuple[list[MBTAPrediction],float]:
+        params: Optional[dict] = None) -> Tuple[list[MBTAPrediction],int]:
 
         base_params = {
             'filter[stop]': ','.join(
@@ -203,7 +224,8 @@ class MBTABaseHandler:
                 self._mbta_stops_ids.get(StopType.ARRIVAL, [])
             ),
             'filter[revenue]': 'REVENUE',
-            'sort': 'departure_time'
+            'sort': 'departure_time',
+            'include': 'trip,route'
         }
 
         if params is not None:
@@ -220,7 +242,7 @@ class MBTABaseHandler:
             for scheduling in schedulings:
 
                 # if schedulings is a prediciton and ScheduleRelationship == specific cases
-                if isinstance(scheduling, MBTAPrediction) and scheduling.schedule_relationship in [MBTAScheduleRelationship.CANCELLED.value, MBTAScheduleRelationship.SKIPPED.value, MBTAScheduleRelationship.NO_DATA.value]:
+                if isinstance(scheduling, MBTAPrediction) and scheduling.schedule_relationship in _DROPPED_SCHEDULE_RELATIONSHIPS:
                     # if the scheduling stop is already in the trips
                     if  scheduling.trip_id in trips:
                         # remove it
@@ -235,21 +257,25 @@ class MBTABaseHandler:
                     # Or get the trip with same trop_id from the trips
                     trip = trips[scheduling.trip_id]
 
+                # Set the mbta_trip id for the trip (the trip is side-loaded in the objStore via include)
+                if not trip._mbta_trip_id and scheduling.trip_id:
+                    trip._mbta_trip_id = scheduling.trip_id
+
                 #Set the mbta_route for the trip,
                 if not trip.mbta_route and scheduling.route_id:
-                    # if the route in the objStore
+                    # if the route in the objStore (side-loaded via include)
                     if MBTARouteObjStore.get_by_id(scheduling.route_id):
                         # set the route id for the trip
                         trip._mbta_route_id = scheduling.route_id
                     else:
-                        # fetch the route
+                        # fallback: fetch the route
                         mbta_route, _ = await self._mbta_client.fetch_route(scheduling.route_id)
                         # set the route for the trip (it will set the route id and store the obj in the objstore)
                         trip.mbta_route = mbta_route
 
                 # if route type 0 or 1 and MBTASchedule skipp
                 #https://www.mbta.com/developers/v3-api/best-practices#predictions
-                if trip.mbta_route.type in [0,1] and isinstance(scheduling, MBTASchedule):
+                if trip.mbta_route.type in _SUBWAY_ROUTE_TYPES and isinstance(scheduling, MBTASchedule):
                     #Unfortunately in some corner cases there may be more trips type for the same trip...cannot break
                     continue
 
@@ -303,18 +329,22 @@ class MBTABaseHandler:
             mbta_vehicles, _ = await task_vehicles
             mbta_alerts, _ = await task_alerts
 
+            today = datetime.now().date()
             for trip_id, trip in trips.items():
+                # The latest fetches stored fresh route/trip/vehicle objects under the same ids
+                trip.reset_registry_caches()
+
                 # # Assign the trip ID if not already set
                 # if not trip.mbta_trip and not trip.mbta_trip.id:
                 #     trip.mbta_trip.id = trip_id
 
-                # Fetch and assign the MBTA trip if not already set
+                # Fetch and assign the MBTA trip if not side-loaded with the scheduling
                 if not trip.mbta_trip:
                     mbta_trip, _ = await self._mbta_client.fetch_trip(id=trip_id)
                     trip.mbta_trip = mbta_trip
     
                 # If the the trip is day1+ do not add vehicle info
-                if trip.departure_time.date() == datetime.now().date():
+                if trip.departure_time.date() == today:
 
                     # Match vehicle for the trip
                     matching_vehicles = [vehicle for vehicle in mbta_vehicles if vehicle.trip_id == trip_id]
@@ -469,7 +499,7 @@ class MBTABaseHandler:
 
         """Filter and sort trips based on conditions like direction, departure, and arrival times."""
         self._logger.debug("Filtering Trips")
-        now = datetime.now().astimezone()
+        now = datetime.now(timezone.utc)
         filtered_trips: dict[str, Trip] = {}
 
         try:
@@ -502,19 +532,19 @@ class MBTABaseHandler:
                 if remove_departed and departure_stop:
                 
                     
-                    if trip.has_departed(departure_stop, time_to_departure=departure_stop.time_to_departure.total_seconds(), filtering_grace_period=self.FILTER_GRACE_PERIOD):
+                    if trip.has_departed(departure_stop, time_to_departure=(departure_stop.departure_time - now).total_seconds(), filtering_grace_period=self.FILTER_GRACE_PERIOD):
                         continue
                 
                 # Remove trips that have already arrived + REMOVAL_BUFFER_THRESHOLD
                 if arrival_stop:
                 
-                    if trip.has_arrived(arrival_stop,time_to_arrival=arrival_stop.time_to_arrival.total_seconds(),filtering_grace_period=self.FILTER_GRACE_PERIOD):
+                    if trip.has_arrived(arrival_stop,time_to_arrival=(arrival_stop.arrival_time - now).total_seconds(),filtering_grace_period=self.FILTER_GRACE_PERIOD):
                         continue
 
                 # Add the valid trip to the processed trips
                 filtered_trips[trip_id] = trip
 
-            return dict(list(filtered_trips.items())[:(self._max_trips * 2)])
+            return dict(islice(filtered_trips.items(), self._max_trips * 2))
 
         except Exception as e:
             self._logger.error(f"Error filtering trips: {e}")
@@ -528,17 +558,17 @@ class MBTABaseHandler:
         self._logger.debug("Cleaning Trips")
         try:
 
-            today = datetime.now()
+            # trips without a stop time sort last, the fallback is computed once for all of them
+            no_time = (datetime.now() + timedelta(days=365)).astimezone()
+
+            def sort_key(item: tuple[str, Trip]) -> datetime:
+                stop = item[1].get_stop_by_type(sort_by)
+                stop_time = stop.time if stop else None
+                return stop_time if stop_time is not None else no_time
+
             sorted_trips: dict[str, Trip] = {
                 trip_id: trip
-                for trip_id, trip in sorted(
-                    trips.items(),
-                    key=lambda item: (
-                        item[1].get_stop_by_type(sort_by).time
-                        if item[1].get_stop_by_type(sort_by) and item[1].get_stop_by_type(sort_by).time is not None
-                        else (today + timedelta(days=365)).astimezone()
-                    )
-                )
+                for trip_id, trip in sorted(trips.items(), key=sort_key)
             }
 
             return sorted_trips
@@ -549,6 +579,8 @@ class MBTABaseHandler:
 
     async def _update_mbta_stops_for_trips(self, trips: list[Trip]) -> None:
 
+        get_by_id = MBTAStopObjStore.get_by_id
+        store = MBTAStopObjStore.store
         for trip in trips:
             params = {
                     'filter[route]': trip.mbta_route.id,
@@ -556,9 +588,12 @@ class MBTABaseHandler:
             }
             mbta_stops, _ = await self._mbta_client.fetch_stops(params=params)
             for mbta_stop in mbta_stops:
-                if mbta_stop.id not in self._mbta_stops_ids or not MBTAStopObjStore.get_by_id(mbta_stop.id):
+                if mbta_stop.id not in self._mbta_stops_ids or not get_by_id(mbta_stop.id):
                     self._mbta_trip_stops_ids.add(mbta_stop.id)
-                    MBTAStopObjStore.store(mbta_stop)
+                    store(mbta_stop)
+
+        # The departure/arrival stops of the trips to render, resolved together
+        Stop.resolve_many(stop for trip in trips for stop in trip.stops)
 
 class MBTAStopError(Exception):
     pass
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime
+from itertools import islice
 from typing import Optional
 
 from .base_handler import MBTABaseHandler
@@ -73,9 +74,7 @@ class DeparturesHandler(MBTABaseHandler):
                 require_both_stops=False)
 
             # Limit trips to the maximum allowed
-            limited_trips = dict(list(filtered_trips.items())[:self._max_trips])
-
-            return list(limited_trips.values())
+            return list(islice(filtered_trips.values(), self._max_trips))
 
         except Exception as e:
             self._logger.error(f"Error updating trips: {e}")
@@ -45,9 +45,11 @@ class TrainsHandler(MBTABaseHandler):
         try:
             mbta_trips, _ = await self.__fetch_trips_by_name(trip_name)
             if mbta_trips:
+                get_by_id = MBTATripObjStore.get_by_id
+                store = MBTATripObjStore.store
                 for mbta_trip in mbta_trips:
-                    if not MBTATripObjStore.get_by_id(mbta_trip.id):
-                        MBTATripObjStore.store(mbta_trip)
+                    if not get_by_id(mbta_trip.id):
+                        store(mbta_trip)
                     if mbta_trip.id not in self._mbta_trips_id:
                         self._mbta_trips_id.append(mbta_trip.id)
             else:
@@ -58,7 +60,7 @@ class TrainsHandler(MBTABaseHandler):
             self._logger.error(f"Error updating MBTA trips: {e}")
             raise
 
-    async def __fetch_trips_by_name(self, train_name: str) -> Tuple[list[MBTATrip], float]:
+    async def __fetch_trips_by_name(self, train_name: str) -> Tuple[list[MBTATrip], int]:
         params = {
             'filter[revenue]': 'REVENUE',
             'filter[name]': train_name
@@ -109,7 +111,7 @@ class TrainsHandler(MBTABaseHandler):
                 await task_stops
                 detailed_trip = await tasks_trips_details
 
-                trains.append(list(detailed_trip.values())[0])
+                trains.append(next(iter(detailed_trip.values())))
 
             return trains
 
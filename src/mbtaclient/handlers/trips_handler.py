@@ -1,5 +1,6 @@
 import asyncio
 from datetime import datetime
+from itertools import islice
 from typing import Optional
 import logging
 
@@ -75,11 +76,8 @@ class TripsHandler(MBTABaseHandler):
                 remove_departed=True,
                 sort_by=self._sort_by)
 
-            # Limit trips to the maximum allowed
-            limited_trips = dict(list(filtered_detailed_trips.items())[:self._max_trips])
-
-            # Return the sorted trips as a list
-            return list(limited_trips.values())
+            # Limit trips to the maximum allowed and return the sorted trips as a list
+            return list(islice(filtered_detailed_trips.values(), self._max_trips))
 
         except Exception as e:
             self._logger.error(f"Failed to update trips: {e}")
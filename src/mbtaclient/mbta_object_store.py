@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from threading import RLock
-from typing import Generic, TypeVar, Optional
+from typing import Generic, Iterable, TypeVar, Optional
 
 from .models.mbta_alert import MBTAAlert
 from .models.mbta_route import MBTARoute
@@ -25,6 +25,22 @@ class MBTABaseObjStore(Generic[T]):
                 cls._registry.move_to_end(id)
             return obj
 
+    @classmethod
+    def get_many(cls, ids: Iterable[str]) -> list[T]:
+        """Retrieve the objects for the given IDs, skipping missing ones, and mark them as recently used."""
+        with cls._lock:
+            registry = cls._registry
+            objs = [obj for obj in map(registry.get, ids) if obj is not None]
+            for obj in objs:
+                registry.move_to_end(obj.id)
+            return objs
+
+    @classmethod
+    def is_stored(cls, obj: T) -> bool:
+        """Return True if this very object is the one registered under its ID, without marking it as used."""
+        with cls._lock:
+            return cls._registry.get(getattr(obj, 'id', None)) is obj
+
     @classmethod
     def store(cls, obj: T) -> None:
         """Add an object to the registry."""
@@ -1,8 +1,16 @@
 from datetime import datetime
 from enum import Enum
 import logging
+from operator import itemgetter
 from typing import Any, Optional
 
+_GET_ID = itemgetter('id')
+
+
+def _has_id(resource: dict[str, Any]) -> bool:
+    return resource.get('id') is not None
+
+
 class MBTAPrediction:
     """A prediction object to hold information about a prediction."""
     
@@ -20,17 +28,11 @@ class MBTAPrediction:
             self.revenue_status: Optional[str] = attributes.get('revenue_status', None)
             self.direction_id: Optional[int] = attributes.get('direction_id', None)        
             self.departure_uncertainty: Optional[int] = attributes.get('departure_uncertainty', None)
-            self.departure_time: Optional[datetime] = (
-                datetime.fromisoformat(attributes.get('departure_time'))
-                if attributes.get('departure_time') is not None
-                else None
-            )
+            departure_time = attributes.get('departure_time')
+            self.departure_time: Optional[datetime] = datetime.fromisoformat(departure_time) if departure_time is not None else None
             self.arrival_uncertainty: Optional[int] = attributes.get('arrival_uncertainty', None)
-            self.arrival_time: Optional[datetime] = (
-                datetime.fromisoformat(attributes.get('arrival_time'))
-                if attributes.get('arrival_time') is not None
-                else None
-            )
+            arrival_time = attributes.get('arrival_time')
+            self.arrival_time: Optional[datetime] = datetime.fromisoformat(arrival_time) if arrival_time is not None else None
             
             # Relationships
             relationships: dict = prediction.get('relationships', {})
@@ -40,9 +42,8 @@ class MBTAPrediction:
             self.schedule_id: Optional[str] = relationships.get('schedule', {}).get('data', {}).get('id', None) if relationships.get('schedule', {}).get('data') is not None else None
             self.route_id: Optional[str] = relationships.get('route', {}).get('data', {}).get('id', None) if relationships.get('route', {}).get('data') is not None else None
             # Extract a list of alert IDs
-            self.alerts_id: Optional[list[Optional[str]]] = [
-                alert.get('id') for alert in relationships.get('alerts', {}).get('data', []) if alert.get('id') is not None
-            ]
+            # Skip the resource identifiers without an id
+            self.alerts_id: list[str] = list(map(_GET_ID, filter(_has_id, (relationships.get('alerts') or {}).get('data') or [])))
             
         except Exception as e:
             # Log the exception with traceback
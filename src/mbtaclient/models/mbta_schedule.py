@@ -18,16 +18,10 @@ class MBTASchedule:
             self.pickup_type: Optional[int] = attributes.get('pickup_type', None)
             self.drop_off_type: Optional[int] = attributes.get('drop_off_type', None)
             self.direction_id: Optional[int] = attributes.get('direction_id', None)
-            self.departure_time: Optional[datetime] = (
-                datetime.fromisoformat(attributes.get('departure_time'))
-                if attributes.get('departure_time') is not None
-                else None
-            )
-            self.arrival_time: Optional[datetime] = (
-                datetime.fromisoformat(attributes.get('arrival_time'))
-                if attributes.get('arrival_time') is not None
-                else None
-            )
+            departure_time = attributes.get('departure_time')
+            self.departure_time: Optional[datetime] = datetime.fromisoformat(departure_time) if departure_time is not None else None
+            arrival_time = attributes.get('arrival_time')
+            self.arrival_time: Optional[datetime] = datetime.fromisoformat(arrival_time) if arrival_time is not None else None
 
             # Relationships
             relationships = schedule.get('relationships', {})
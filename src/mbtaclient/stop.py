@@ -1,16 +1,21 @@
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
-from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Iterable, Optional
+from datetime import datetime, timedelta, timezone
 
 from .mbta_object_store import MBTAStopObjStore
 from .models.mbta_stop import MBTAStop
 
-class StopType(Enum):
+# bound once, the stop resolution runs on every mbta_stop read
+_get_mbta_stop = MBTAStopObjStore.get_by_id
+
+
+# a str subclass, so hashing and equality (stop index and cache keys) take the str fast path
+class StopType(StrEnum):
     DEPARTURE = "departure"
     ARRIVAL = "arrival"
 
-@dataclass
+@dataclass(slots=True)
 class Time:
     """
     Represents a time with optional original and updated values.
@@ -34,17 +39,29 @@ class Time:
     def time(self) -> Optional[datetime]:
         return self.predicted_time or self.scheduled_time
 
-@dataclass
 class Stop:
     """
     Represents a stop on a trip.
     """
+    # plain slotted class: the custom __init__ replaces the dataclass-generated one anyway
+    __slots__ = (
+        "stop_type", "mbta_stop_id", "stop_sequence", "arrival", "departure", "status",
+        "_time", "_deltatime", "_arrival_ts", "_departure_ts", "_mbta_stop_cache",
+    )
+
     stop_type: StopType
     mbta_stop_id: str
     stop_sequence: int
-    arrival: Optional[Time] = None
-    departure: Optional[Time] = None
-    status: Optional[str] = None
+    arrival: Optional[Time]
+    departure: Optional[Time]
+    status: Optional[str]
+    # derived from the current arrival/departure times, refreshed whenever the times change
+    _time: Optional[datetime]
+    _deltatime: Optional[timedelta]
+    _arrival_ts: Optional[float]
+    _departure_ts: Optional[float]
+    # MBTAStop resolved from the registry, reused while mbta_stop_id is unchanged
+    _mbta_stop_cache: Optional[MBTAStop]
 
     def __init__(
         self,
@@ -70,68 +87,84 @@ class Stop:
         self.arrival = Time(scheduled_time=arrival_time) if arrival_time else None
         self.departure = Time(scheduled_time=departure_time) if departure_time else None
         self.status = status
+        self._mbta_stop_cache = None
+        self._update_times()
+
+    def _update_times(self) -> None:
+        arrival, departure = self.arrival, self.departure
+        arrival_time = arrival.time if arrival else None
+        departure_time = departure.time if departure else None
+        # the stop time is the arrival one, the departure one when there is no arrival
+        self._time = arrival_time if arrival else departure_time
+        self._deltatime = (arrival.deltatime if arrival else None) or (departure.deltatime if departure else None) or None
+        self._arrival_ts = arrival_time.timestamp() if arrival_time else None
+        self._departure_ts = departure_time.timestamp() if departure_time else None
 
     @property
     def mbta_stop(self) -> Optional[MBTAStop]:
         """Retrieve the MBTAStop object for this TripStop."""
-        mbta_stop = MBTAStopObjStore.get_by_id(self.mbta_stop_id)
-        if mbta_stop:
-            return mbta_stop
-        return None
+        mbta_stop = self._mbta_stop_cache
+        if mbta_stop is None or mbta_stop.id != self.mbta_stop_id:
+            mbta_stop = self._mbta_stop_cache = _get_mbta_stop(self.mbta_stop_id)
+        return mbta_stop
+
+    @staticmethod
+    def resolve_many(stops: Iterable["Stop"]) -> None:
+        """Resolve the MBTAStop of the given stops not resolved yet, with one store lookup."""
+        unresolved = [
+            stop for stop in stops
+            if stop._mbta_stop_cache is None or stop._mbta_stop_cache.id != stop.mbta_stop_id
+        ]
+        if not unresolved:
+            return
+        mbta_stops = {mbta_stop.id: mbta_stop for mbta_stop in MBTAStopObjStore.get_many({stop.mbta_stop_id for stop in unresolved})}
+        for stop in unresolved:
+            stop._mbta_stop_cache = mbta_stops.get(stop.mbta_stop_id)
 
     @mbta_stop.setter
     def mbta_stop(self, mbta_stop: "MBTAStop") -> None:
         """Set the MBTAStop and add it to the registry."""
+        # Re-assigning the stop already set and registered is a no-op
+        if mbta_stop.id == self.mbta_stop_id and MBTAStopObjStore.is_stored(mbta_stop):
+            self._mbta_stop_cache = mbta_stop
+            return
         self.mbta_stop_id = mbta_stop.id  # Update the stop ID
+        self._mbta_stop_cache = mbta_stop
         MBTAStopObjStore.store(mbta_stop)  # Add to store
 
     @property
     def arrival_time(self) -> Optional[datetime]:
-        if self.arrival and self.arrival.time:
-            return self.arrival.time
-        return None
+        return self.arrival.time if self.arrival else None
 
     @property
     def departure_time(self) -> Optional[datetime]:
-        if self.departure and self.departure.time:
-            return self.departure.time
-        return None
+        return self.departure.time if self.departure else None
 
     @property
     def time(self) -> Optional[datetime]:
         """Returns the most recent time for this stop (updated or original)."""
-        if self.arrival:
-            return self.arrival.time
-        elif self.departure:
-            return self.departure.time
-        else:
-            return None
+        return self._time
 
     @property
     def deltatime(self) -> Optional[timedelta]:
-        if self.arrival and self.arrival.deltatime:
-            return self.arrival.deltatime
-        if self.departure and self.departure.deltatime:
-            return self.departure.deltatime
-        return None
+        return self._deltatime
+
+    # from the stop epoch timestamps: naive times count as local time, like .astimezone() does
+    @staticmethod
+    def _time_to(timestamp: Optional[float]) -> Optional[timedelta]:
+        return timedelta(seconds=timestamp - datetime.now(timezone.utc).timestamp()) if timestamp is not None else None
 
     @property
     def time_to(self) -> Optional[timedelta]:
-        if self.time:
-            return self.time.astimezone() - datetime.now().astimezone()
-        return None
-    
+        return self._time_to(self._arrival_ts if self.arrival else self._departure_ts)
+
     @property
     def time_to_departure(self) -> Optional[timedelta]:
-        if self.departure_time:
-            return self.departure_time.astimezone() - datetime.now().astimezone()
-        return None
-    
+        return self._time_to(self._departure_ts)
+
     @property
     def time_to_arrival(self) -> Optional[timedelta]:
-        if self.arrival_time:
-            return self.arrival_time.astimezone() - datetime.now().astimezone()
-        return None
+        return self._time_to(self._arrival_ts)
 
     def __repr__(self) -> str:
         return (f"TripStop({self.stop_type.value}): {self.mbta_stop_id} @ {self.time.replace(tzinfo=None)}"
@@ -167,3 +200,4 @@ class Stop:
                 self.departure = Time(scheduled_time=departure_time)
             else:
                 self.departure.predicted_time = departure_time
+        self._update_times()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Union, Optional
-from datetime import datetime
+from typing import NamedTuple, Union, Optional
+import time
+from datetime import datetime, timedelta, timezone
 
 from .mbta_object_store import MBTAAlertObjStore, MBTARouteObjStore, MBTAStopObjStore, MBTATripObjStore, MBTAVehicleObjStore
 
@@ -13,15 +14,53 @@ from .models.mbta_trip import MBTATrip
 from .models.mbta_vehicle import MBTAVehicle
 from .models.mbta_alert import MBTAAlert
 
+_LONG_NAME_ROUTE_TYPES = frozenset((0, 1, 2, 4))  # subway + train + ferry, named by long_name
+# countdown strings for 0-59 minutes, under 2 minutes reads "1 min"
+_MIN_STRINGS = ("1 min", "1 min", *(f"{minutes} min" for minutes in range(2, 60)))
 
-@dataclass
+
+def _alert_detail(mbta_alert: MBTAAlert) -> str:
+    # Use short_header if available, otherwise fallback to full header
+    return (mbta_alert.short_header or "").strip() or (mbta_alert.header or "").strip()
+
+
+class _StopState(NamedTuple):
+    """Inputs of the stop status checks, computed once per evaluation."""
+    time_to_arrival: float
+    time_to_departure: float
+    vehicle_stop: Optional[int]  # None without vehicle data
+    vehicle_status: Optional[str]
+    vehicle_data_age: Optional[timedelta]
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class Trip:
     """A class to manage a Trip with multiple stops."""
     _mbta_route_id: Optional[str] = None
     _mbta_trip_id: Optional[str] = None
     _mbta_vehicle_id: Optional[str] = None
-    _mbta_alerts_ids: set[Optional[str]] = field(default_factory=set)
+    _mbta_alerts_ids: set[str] = field(default_factory=set)
     stops: list[Optional['Stop']] = field(default_factory=list)
+    # objects resolved from the registries, reused while the matching id is unchanged, until reset_registry_caches()
+    _mbta_route_cache: Optional[MBTARoute] = field(default=None, init=False)
+    _mbta_trip_cache: Optional[MBTATrip] = field(default=None, init=False)
+    _mbta_vehicle_cache: Optional[MBTAVehicle] = field(default=None, init=False)
+    # stops indexed by type, kept in sync with `stops`
+    _stops_by_type: dict[StopType, Stop] = field(default_factory=dict, init=False)
+    # formatted vehicle status, reused while the resolved vehicle is the same object
+    _vehicle_status_cache: Optional[tuple[MBTAVehicle, str]] = field(default=None, init=False)
+    # (vehicle stop id, stop name) of the last vehicle stop name found
+    _vehicle_stop_name_cache: Optional[tuple[str, str]] = field(default=None, init=False)
+    # derived display values, reused while their source is unchanged
+    _route_color_cache: Optional[tuple[Optional[MBTARoute], Optional[str]]] = field(default=None, init=False)
+    # formatted alerts, rebuilt when new alerts are registered
+    _alerts: frozenset[str] = field(default=frozenset(), init=False)
+    # snapshot of _mbta_alerts_ids for reads, rebuilt after the ids change
+    _mbta_alerts_ids_tuple: Optional[tuple[str, ...]] = field(default=None, init=False)
+    # alerts set on the trip by id, registered in the store on first access
+    _pending_alerts: dict[str, MBTAAlert] = field(default_factory=dict, init=False)
+    # countdowns memoized for the current second, cleared when stops or vehicle change
+    _countdown_cache: dict[tuple[str, StopType], tuple[int, Optional[str]]] = field(default_factory=dict, init=False)
 
     VEHICLE_DATA_FRESHNESS_DATA_THRESHOLD = 60  # second, treshold to consider vehichle data fresh
     VEHICLE_DATA_LIVENESS_DATA_THRESHOLD = 20  # seconds, treshold to consider vehichle data live and ovverride departure/arrival time for countdown
@@ -29,251 +68,344 @@ class Trip:
     VEHICLE_DATA_BOARDING_BUFFER_TIME_POST_DEPARTURE = -30 # seconds, how much buffer time to consider after departure time when vehicle data
     STOP_COUNTDOWN_THRESHOLD = 30 # seconds, minimum time for boarding/arriving (eg countodwn = boarding is true while COUNTDOW_TRESHOLD sec > sec to departure time)
 
+    # vehicle data thresholds as timedelta, to compare against the vehicle data age directly
+    _VEHICLE_DATA_FRESHNESS_DELTA = timedelta(seconds=VEHICLE_DATA_FRESHNESS_DATA_THRESHOLD)
+    _VEHICLE_DATA_LIVENESS_DELTA = timedelta(seconds=VEHICLE_DATA_LIVENESS_DATA_THRESHOLD)
+
+    def __repr__(self) -> str:
+        return f"Trip:{self._mbta_trip_id}"
+
     # registry
     @property
     def mbta_route(self) -> Optional[MBTARoute]:
         """Retrieve the MBTARoute object for this Trip."""
-        mbta_route = MBTARouteObjStore.get_by_id(self._mbta_route_id)
-        if mbta_route:
-            return mbta_route
-        return None
+        mbta_route = self._mbta_route_cache
+        if mbta_route is None or mbta_route.id != self._mbta_route_id:
+            mbta_route = self._mbta_route_cache = MBTARouteObjStore.get_by_id(self._mbta_route_id)
+        return mbta_route
 
     @mbta_route.setter
     def mbta_route(self, mbta_route: MBTARoute) -> None:
         if mbta_route:
             self._mbta_route_id = mbta_route.id
+            self._mbta_route_cache = mbta_route
             MBTARouteObjStore.store(mbta_route)
 
     @property
     def mbta_trip(self) -> Optional[MBTATrip]:
-        """Retrieve the MBTARoute object for this Trip."""
-        mbta_trip = MBTATripObjStore.get_by_id(self._mbta_trip_id)
-        if mbta_trip:
-            return mbta_trip
-        return None
+        """Retrieve the MBTATrip object for this Trip."""
+        mbta_trip = self._mbta_trip_cache
+        if mbta_trip is None or mbta_trip.id != self._mbta_trip_id:
+            mbta_trip = self._mbta_trip_cache = MBTATripObjStore.get_by_id(self._mbta_trip_id)
+        return mbta_trip
 
     @mbta_trip.setter
     def mbta_trip(self, mbta_trip: MBTATrip) -> None:
         if mbta_trip:
             self._mbta_trip_id = mbta_trip.id
+            self._mbta_trip_cache = mbta_trip
             MBTATripObjStore.store(mbta_trip)
 
     @property
     def mbta_vehicle(self) -> Optional[MBTAVehicle]:
-        """Retrieve the MBTARoute object for this Trip."""
-        return MBTAVehicleObjStore.get_by_id(self._mbta_vehicle_id)
+        """Retrieve the MBTAVehicle object for this Trip."""
+        mbta_vehicle = self._mbta_vehicle_cache
+        if mbta_vehicle is None or mbta_vehicle.id != self._mbta_vehicle_id:
+            mbta_vehicle = self._mbta_vehicle_cache = MBTAVehicleObjStore.get_by_id(self._mbta_vehicle_id)
+        return mbta_vehicle
 
     @mbta_vehicle.setter
     def mbta_vehicle(self, mbta_vehicle: MBTAVehicle) -> None:
         if mbta_vehicle:
             self._mbta_vehicle_id = mbta_vehicle.id
+            self._mbta_vehicle_cache = mbta_vehicle
+            self._countdown_cache.clear()
             MBTAVehicleObjStore.store(mbta_vehicle)
 
+    def reset_registry_caches(self) -> None:
+        """Drop the resolved route, trip and vehicle, so the next reads pick up the objects stored by the latest fetch."""
+        self._mbta_route_cache = None
+        self._mbta_trip_cache = None
+        self._mbta_vehicle_cache = None
+        self._countdown_cache.clear()
+
     @property
     def mbta_alerts(self) -> Optional[list[MBTAAlert]]:
-        """Retrieve the MBTARoute object for this Trip."""
-        mbta_alerts = []
-        for mbta_alert_id in self._mbta_alerts_ids:
-            mbta_alerts.append(MBTAAlertObjStore.get_by_id(mbta_alert_id))
-        return mbta_alerts
+        """Retrieve the MBTAAlert objects for this Trip."""
+        if self._pending_alerts:
+            self._register_pending_alerts()
+        mbta_alerts_ids = self._mbta_alerts_ids_tuple
+        if mbta_alerts_ids is None:
+            mbta_alerts_ids = self._mbta_alerts_ids_tuple = tuple(self._mbta_alerts_ids)
+        return MBTAAlertObjStore.get_many(mbta_alerts_ids)
 
     @mbta_alerts.setter
     def mbta_alerts(self, mbta_alerts: list[MBTAAlert]) -> None:
         if mbta_alerts:
-            for mbta_alert in mbta_alerts:
-                self._mbta_alerts_ids.add(mbta_alert.id)
-                MBTAAlertObjStore.store(mbta_alert)
+            # alerts without an id can't be stored nor resolved back,
+            # re-setting the same alerts on every poll replaces the pending ones
+            self._pending_alerts.update(
+                (mbta_alert.id, mbta_alert) for mbta_alert in mbta_alerts if mbta_alert.id)
+
+    def _register_pending_alerts(self) -> None:
+        pending_alerts = self._pending_alerts
+        self._mbta_alerts_ids.update(pending_alerts)
+        store = MBTAAlertObjStore.store
+        for mbta_alert in pending_alerts.values():
+            store(mbta_alert)
+        pending_alerts.clear()
+        self._mbta_alerts_ids_tuple = None
+        # Skip alerts without details, the set drops the duplicates
+        self._alerts = frozenset(
+            f"{mbta_alert.effect.replace('_', ' ')}: {detail}"
+            for mbta_alert in self.mbta_alerts
+            if (detail := _alert_detail(mbta_alert)))
 
     # trip
     @property
     def headsign(self) -> Optional[str]:
-        return self.mbta_trip.headsign if self.mbta_trip and self.mbta_trip.headsign else None
+        mbta_trip = self.mbta_trip
+        return (mbta_trip.headsign or None) if mbta_trip else None
 
     @property
     def name(self) -> Optional[str]:
-        return self.mbta_trip.name if self.mbta_trip and self.mbta_trip.name else None
+        mbta_trip = self.mbta_trip
+        return (mbta_trip.name or None) if mbta_trip else None
 
     @property
     def destination(self) -> Optional[str]:
-        return (
-            self.mbta_route.direction_destinations[self.mbta_trip.direction_id]
-            if self.mbta_trip
-            and self.mbta_trip.direction_id
-            and self.mbta_route
-            and self.mbta_route.direction_destinations
-            else None
-        )
+        mbta_trip = self.mbta_trip
+        mbta_route = self.mbta_route
+        if mbta_trip and mbta_trip.direction_id is not None and mbta_route and mbta_route.direction_destinations:
+            return mbta_route.direction_destinations[mbta_trip.direction_id]
+        return None
 
     @property
     def direction(self) -> Optional[str]:
-        return (
-            self.mbta_route.direction_names[self.mbta_trip.direction_id]
-            if self.mbta_trip
-            and self.mbta_trip.direction_id
-            and self.mbta_route
-            and self.mbta_route.direction_names
-            else None
-        )
+        mbta_trip = self.mbta_trip
+        mbta_route = self.mbta_route
+        if mbta_trip and mbta_trip.direction_id is not None and mbta_route and mbta_route.direction_names:
+            return mbta_route.direction_names[mbta_trip.direction_id]
+        return None
 
     @property
     def duration(self) -> Optional[int]:
-        if self._departure_stop and self._arrival_stop:
-            return int((self._arrival_stop.time -  self._departure_stop.time).total_seconds())
+        departure_stop = self._departure_stop
+        arrival_stop = self._arrival_stop
+        if departure_stop and arrival_stop:
+            return int((arrival_stop.time - departure_stop.time).total_seconds())
         return None
 
     # route
     @property
     def route_name(self) -> Optional[str]:
-        if self.mbta_route and self.mbta_route.type in [0,1,2,4]: #subway + train + ferry
-            return self.mbta_route.long_name if self.mbta_route and self.mbta_route.long_name else None
-        elif self.mbta_route and self.mbta_route.type == 3: #bus
-            return self.mbta_route.short_name if self.mbta_route and self.mbta_route.short_name else None
+        mbta_route = self.mbta_route
+        if not mbta_route:
+            return None
+        if mbta_route.type in _LONG_NAME_ROUTE_TYPES: #subway + train + ferry
+            return mbta_route.long_name or None
+        elif mbta_route.type == 3: #bus
+            return mbta_route.short_name or None
+        return None
 
     @property
     def route_color(self) -> Optional[str]:
-        return f"#{self.mbta_route.color}" if self.mbta_route and self.mbta_route.color else None
+        mbta_route = self.mbta_route
+        cached = self._route_color_cache
+        if cached is None or cached[0] is not mbta_route:
+            route_color = f"#{mbta_route.color}" if mbta_route and mbta_route.color else None
+            cached = self._route_color_cache = (mbta_route, route_color)
+        return cached[1]
 
     @property
     def route_description(self) -> Optional[str]:
-        return MBTARoute.get_route_type_desc_by_type_id(self.mbta_route.type) if self.mbta_route and self.mbta_route.type is not None else None
+        mbta_route = self.mbta_route
+        if mbta_route and mbta_route.type is not None:
+            return MBTARoute.ROUTE_TYPES.get(mbta_route.type, 'Unknown')
+        return None
 
     # vehicle
     @property
     def vehicle_status(self) -> Optional[str]:
-        if self.mbta_vehicle and self.mbta_vehicle.current_status and self.vehicle_stop_name:
-            title_case_with_spaces = " ".join([word.capitalize() for word in self.mbta_vehicle.current_status.split("_")])
-            return title_case_with_spaces + " " + self.vehicle_stop_name
-        return None
+        mbta_vehicle = self.mbta_vehicle
+        cached = self._vehicle_status_cache
+        if cached is not None and cached[0] is mbta_vehicle:
+            return cached[1]
+        if not (mbta_vehicle and mbta_vehicle.current_status):
+            return None
+        vehicle_stop_name = self.vehicle_stop_name
+        if not vehicle_stop_name:
+            # the stop may be stored later, don't remember the miss
+            return None
+        vehicle_status = mbta_vehicle.current_status.replace("_", " ").title() + " " + vehicle_stop_name
+        self._vehicle_status_cache = (mbta_vehicle, vehicle_status)
+        return vehicle_status
 
     @property
     def vehicle_stop_name(self) -> Optional[str]:
-        return MBTAStopObjStore.get_by_child_stop_id(self.mbta_vehicle.stop_id).name if self.mbta_vehicle and self.mbta_vehicle.stop_id and MBTAStopObjStore.get_by_child_stop_id(self.mbta_vehicle.stop_id) else None
+        mbta_vehicle = self.mbta_vehicle
+        if not (mbta_vehicle and mbta_vehicle.stop_id):
+            return None
+        stop_id = mbta_vehicle.stop_id
+        cached = self._vehicle_stop_name_cache
+        if cached is not None and cached[0] == stop_id:
+            return cached[1]
+        # get_by_child_stop_id scans the whole stop store, remember the names found
+        mbta_stop = MBTAStopObjStore.get_by_child_stop_id(stop_id)
+        if not (mbta_stop and mbta_stop.name):
+            return None
+        self._vehicle_stop_name_cache = (stop_id, mbta_stop.name)
+        return mbta_stop.name
 
     @property
     def vehicle_longitude(self) -> Optional[float]:
-        return self.mbta_vehicle.longitude if self.mbta_vehicle and self.mbta_vehicle.longitude else None
+        mbta_vehicle = self.mbta_vehicle
+        return (mbta_vehicle.longitude or None) if mbta_vehicle else None
 
     @property
     def vehicle_latitude(self) -> Optional[float]:
-        return self.mbta_vehicle.latitude if self.mbta_vehicle and self.mbta_vehicle.latitude else None
+        mbta_vehicle = self.mbta_vehicle
+        return (mbta_vehicle.latitude or None) if mbta_vehicle else None
 
     @property
     def vehicle_occupancy(self) -> Optional[str]:
-        return self.mbta_vehicle.occupancy_status if self.mbta_vehicle and self.mbta_vehicle.occupancy_status else None
+        mbta_vehicle = self.mbta_vehicle
+        return (mbta_vehicle.occupancy_status or None) if mbta_vehicle else None
 
     @property
     def vehicle_speed(self) -> Optional[str]:
-        return self.mbta_vehicle.speed if self.mbta_vehicle and self.mbta_vehicle.speed else None
+        mbta_vehicle = self.mbta_vehicle
+        return (mbta_vehicle.speed or None) if mbta_vehicle else None
 
     @property
     def vehicle_updated_at(self) -> Optional[datetime]:
-        return self.mbta_vehicle.updated_at.replace(tzinfo=None) if self.mbta_vehicle and self.mbta_vehicle.updated_at else None
+        mbta_vehicle = self.mbta_vehicle
+        updated_at = mbta_vehicle.updated_at if mbta_vehicle else None
+        return updated_at.replace(tzinfo=None) if updated_at else None
 
     @property
     def is_vehicle_data_fresh(self) -> bool:
-        if self.mbta_vehicle and self.mbta_vehicle.updated_at:
-            now =  datetime.now().astimezone() # Ensure consistent timezone handling
-            delta = (now - self.mbta_vehicle.updated_at).total_seconds()
-            return delta <= self.VEHICLE_DATA_FRESHNESS_DATA_THRESHOLD
-        return False
+        return self._is_vehicle_data_fresh()
 
     @property
     def is_vehicle_data_live(self) -> bool:
-        if self.mbta_vehicle and self.mbta_vehicle.updated_at:
-            now =  datetime.now().astimezone() # Ensure consistent timezone handling
-            delta = (now - self.mbta_vehicle.updated_at).total_seconds()
-            return delta <= self.VEHICLE_DATA_LIVENESS_DATA_THRESHOLD
-        return False
+        return self._is_vehicle_data_live()
+
+    def _vehicle_data_age(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """Return the time elapsed since the vehicle data was updated, None if no vehicle data."""
+        mbta_vehicle = self.mbta_vehicle
+        if mbta_vehicle and mbta_vehicle.updated_at:
+            now = now or datetime.now(timezone.utc)
+            return now - mbta_vehicle.updated_at
+        return None
+
+    def _is_vehicle_data_fresh(self, now: Optional[datetime] = None) -> bool:
+        age = self._vehicle_data_age(now)
+        return age is not None and age <= self._VEHICLE_DATA_FRESHNESS_DELTA
+
+    def _is_vehicle_data_live(self, now: Optional[datetime] = None) -> bool:
+        age = self._vehicle_data_age(now)
+        return age is not None and age <= self._VEHICLE_DATA_LIVENESS_DELTA
     
     #departure stop
     @property
     def _departure_stop(self) -> Optional[Stop]:
-        return self.get_stop_by_type(StopType.DEPARTURE) if self.get_stop_by_type(StopType.DEPARTURE) else None
+        return self._stops_by_type.get(StopType.DEPARTURE)
 
     @property
     def departure_stop_name(self) -> Optional[str]:
-        return self._departure_stop.mbta_stop.name if self._departure_stop and self._departure_stop.mbta_stop else None
+        stop = self._departure_stop
+        mbta_stop = stop.mbta_stop if stop else None
+        return mbta_stop.name if mbta_stop else None
 
     @property
     def departure_platform(self) -> Optional[str]:
-        return self._departure_stop.mbta_stop.platform_name if self._departure_stop and self._departure_stop.mbta_stop else None
+        stop = self._departure_stop
+        mbta_stop = stop.mbta_stop if stop else None
+        return mbta_stop.platform_name if mbta_stop else None
 
     @property
     def departure_time(self) -> Optional[datetime]:
-        return self._departure_stop.time.replace(tzinfo=None) if self._departure_stop and self._departure_stop.time else None
+        stop = self._departure_stop
+        stop_time = stop.time if stop else None
+        return stop_time.replace(tzinfo=None) if stop_time else None
 
     @property
     def departure_delay(self) -> Optional[int]:
-        return int(self._departure_stop.deltatime.total_seconds()) if self._departure_stop and self._departure_stop.deltatime else None
+        stop = self._departure_stop
+        deltatime = stop.deltatime if stop else None
+        return int(deltatime.total_seconds()) if deltatime else None
 
     @property
     def departure_time_to(self) -> Optional[int]:
-        return int(self._departure_stop.time_to_departure.total_seconds()) if self._departure_stop and self._departure_stop.time_to_departure else None
+        stop = self._departure_stop
+        time_to_departure = stop.time_to_departure if stop else None
+        return int(time_to_departure.total_seconds()) if time_to_departure else None
 
     @property
     def departure_mbta_countdown(self) -> Optional[str]:
-        return self._get_stop_mbta_countdown(StopType.DEPARTURE) if self._departure_stop else None
+        return self._get_stop_mbta_countdown(StopType.DEPARTURE)
 
     @property
     def departure_countdown(self) -> Optional[str]:
-        return self._get_stop_countdown(StopType.DEPARTURE) if self._departure_stop else None
+        return self._get_stop_countdown(StopType.DEPARTURE)
 
     #arrival stop
     @property
     def _arrival_stop(self) -> Optional[Stop]:
-        return self.get_stop_by_type(StopType.ARRIVAL) if self.get_stop_by_type(StopType.ARRIVAL) else None
+        return self._stops_by_type.get(StopType.ARRIVAL)
 
     @property
     def arrival_stop_name(self) -> Optional[str]:
-        return self._arrival_stop.mbta_stop.name if self._arrival_stop and self._arrival_stop.mbta_stop else None
+        stop = self._arrival_stop
+        mbta_stop = stop.mbta_stop if stop else None
+        return mbta_stop.name if mbta_stop else None
 
     @property
     def arrival_platform(self) -> Optional[str]:
-        return self._arrival_stop.mbta_stop.platform_name if self._arrival_stop and self._arrival_stop.mbta_stop else None
+        stop = self._arrival_stop
+        mbta_stop = stop.mbta_stop if stop else None
+        return mbta_stop.platform_name if mbta_stop else None
 
     @property
     def arrival_time(self) -> Optional[datetime]:
-        return self._arrival_stop.time.replace(tzinfo=None) if self._arrival_stop and self._arrival_stop.time else None
+        stop = self._arrival_stop
+        stop_time = stop.time if stop else None
+        return stop_time.replace(tzinfo=None) if stop_time else None
 
     @property
     def arrival_delay(self) -> Optional[int]:
-        return int(self._arrival_stop.deltatime.total_seconds()) if self._arrival_stop and self._arrival_stop.deltatime else None
+        stop = self._arrival_stop
+        deltatime = stop.deltatime if stop else None
+        return int(deltatime.total_seconds()) if deltatime else None
 
     @property
     def arrival_time_to(self) -> Optional[int]:
-        return int(self._arrival_stop.time_to_arrival.total_seconds()) if self._arrival_stop and self._arrival_stop.time_to_arrival else None
+        stop = self._arrival_stop
+        time_to_arrival = stop.time_to_arrival if stop else None
+        return int(time_to_arrival.total_seconds()) if time_to_arrival else None
 
     @property
     def arrival_mbta_countdown(self) -> Optional[str]:
-        return self._get_stop_mbta_countdown(StopType.ARRIVAL) if self._arrival_stop else None
+        return self._get_stop_mbta_countdown(StopType.ARRIVAL)
 
     @property
     def arrival_countdown(self) -> Optional[str]:
-        return self._get_stop_countdown(StopType.ARRIVAL) if self._arrival_stop else None
+        return self._get_stop_countdown(StopType.ARRIVAL)
 
     #alerts
     @property
-    def alerts(self) -> Optional[set[str]]:
-        alerts_details = set()
-        if self.mbta_alerts:
-            for mbta_alert in self.mbta_alerts:
-                effect = " ".join(mbta_alert.effect.split("_"))
-                short_header = mbta_alert.short_header.strip()
-                header = mbta_alert.header.strip() if hasattr(mbta_alert, "header") else ""
-                
-                # Use short_header if available, otherwise fallback to full header
-                detail = short_header if short_header else header
-                if detail:  # only add if detail is not empty
-                    alerts_details.add(f"{effect}: {detail}")
-            
-            return alerts_details if alerts_details else None
-        return None
+    def alerts(self) -> Optional[frozenset[str]]:
+        if self._pending_alerts:
+            self._register_pending_alerts()
+        return self._alerts or None
 
-    def get_stop_by_type(self, stop_type: str) -> Optional[Stop]:
-        return next((stop for stop in self.stops if stop and stop.stop_type == stop_type), None)
+    def get_stop_by_type(self, stop_type: StopType) -> Optional[Stop]:
+        return self._stops_by_type.get(stop_type)
 
-    def add_stop(self, stop_type: str, scheduling: Union[MBTASchedule, MBTAPrediction], mbta_stop_id: str) -> None:
+    def add_stop(self, stop_type: StopType, scheduling: Union[MBTASchedule, MBTAPrediction], mbta_stop_id: str) -> None:
         """Add or update a stop in the journey."""
+        self._countdown_cache.clear()
         stop = self.get_stop_by_type(stop_type)
 
         ##Status from prediction
@@ -292,6 +424,7 @@ class Trip:
                 status=status
             )
             self.stops.append(stop)
+            self._stops_by_type[stop_type] = stop
         else:
             # Update existing Stop
             stop.update_stop(
@@ -303,199 +436,257 @@ class Trip:
             )
 
     def remove_stop_by_id(self, mbta_stop_id: str) -> None:
-        self.stops = [stop for stop in self.stops if stop.mbta_stop.id != mbta_stop_id]
+        # match on the stop's own id, the MBTAStop may not be in the store
+        stops = [stop for stop in self.stops if stop.mbta_stop_id != mbta_stop_id]
+        if len(stops) != len(self.stops):
+            self.stops = stops
+            self._stops_by_type = {stop.stop_type: stop for stop in stops}
+            self._countdown_cache.clear()
 
     def reset_stops(self):
         self.stops = []
+        self._stops_by_type = {}
+        self._countdown_cache.clear()
 
     def get_stop_id_by_stop_type(self, stop_type: StopType) -> Optional[str]:
         """Return the stop ID of the stop of the given type."""
-        if stop_type == StopType.DEPARTURE and self._departure_stop and self._departure_stop.mbta_stop:
-            return self._departure_stop.mbta_stop.id
-        if stop_type == StopType.ARRIVAL and self._arrival_stop and self._arrival_stop.mbta_stop:
-            return self._arrival_stop.mbta_stop.id
-        return None
+        stop = self._stops_by_type.get(stop_type)
+        mbta_stop = stop.mbta_stop if stop else None
+        return mbta_stop.id if mbta_stop else None
 
     def get_stops_ids(self) -> list[str]:
         """Return IDs of departure and arrival stops, excluding None."""
-        return [
-            stop_id for stop_id in [
-                self.get_stop_id_by_stop_type(StopType.DEPARTURE),
-                self.get_stop_id_by_stop_type(StopType.ARRIVAL)
-            ] if stop_id is not None
-        ]
+        stops_ids = []
+        for stop in (self._departure_stop, self._arrival_stop):
+            mbta_stop = stop.mbta_stop if stop else None
+            if mbta_stop:
+                stops_ids.append(mbta_stop.id)
+        return stops_ids
 
     def get_alert_header(self, alert_index: int) -> Optional[str]:
-        if 0 <= alert_index < len(self.mbta_alerts):
-            return self.mbta_alerts[alert_index].header
+        mbta_alerts = self.mbta_alerts
+        if 0 <= alert_index < len(mbta_alerts):
+            return mbta_alerts[alert_index].header
         return None
 
-    def _get_stop_countdown(self, stop_type: StopType) -> Optional[str]:
+    def _get_cached_countdown(self, key: str, compute, stop: Stop) -> Optional[str]:
+        """Return compute(stop, now), memoized for the current second."""
+        now_s = int(time.time())
+        cache_key = (key, stop.stop_type)
+        cached = self._countdown_cache.get(cache_key)
+        if cached is not None and cached[0] == now_s:
+            return cached[1]
+        countdown = compute(stop, datetime.now(timezone.utc))
+        self._countdown_cache[cache_key] = (now_s, countdown)
+        return countdown
+
+    def _get_stop_countdown(self, stop_type: StopType, now: Optional[datetime] = None) -> Optional[str]:
         """Determine the countdown or status of a stop."""
-
-        stop: Stop = self.get_stop_by_type(stop_type)
+        stop = self._stops_by_type.get(stop_type)
         if not stop:
             return None
+        if now is None:
+            return self._get_cached_countdown("countdown", self._compute_stop_countdown, stop)
+        return self._compute_stop_countdown(stop, now)
 
+    def _get_stop_mbta_countdown(self, stop_type: StopType, now: Optional[datetime] = None) -> Optional[str]:
+        """Determine the countdown to a stop based on vehicle and time following
+        https://www.mbta.com/developers/v3-api/best-practices """
+        stop = self._stops_by_type.get(stop_type)
+        if not stop:
+            return None
+        if now is None:
+            return self._get_cached_countdown("mbta_countdown", self._compute_stop_mbta_countdown, stop)
+        return self._compute_stop_mbta_countdown(stop, now)
+
+    def _compute_stop_state(
+        self,
+        time_to_arrival: float,
+        time_to_departure: float,
+        now: Optional[datetime] = None) -> _StopState:
+        """Collect the vehicle position and data age shared by the stop status checks.
+        The vehicle data age is only evaluated when now is given."""
+        mbta_vehicle = self.mbta_vehicle
+        vehicle_stop = mbta_vehicle.current_stop_sequence if mbta_vehicle else None
+        if vehicle_stop is None:
+            return _StopState(time_to_arrival, time_to_departure, None, None, None)
+        updated_at = mbta_vehicle.updated_at
+        vehicle_data_age = now - updated_at if now and updated_at else None
+        return _StopState(
+            time_to_arrival,
+            time_to_departure,
+            vehicle_stop,
+            mbta_vehicle.current_status,
+            vehicle_data_age)
+
+    def _compute_stop_countdown(self, stop: Stop, now: datetime) -> Optional[str]:
         if stop.status:
             return stop.status
 
-        if not stop.time:
+        arrival_ts = stop._arrival_ts
+        departure_ts = stop._departure_ts
+        if arrival_ts is None and departure_ts is None:
             return None
 
-        time_to_departure = stop.time_to_departure.total_seconds() if stop.time_to_departure else stop.time_to.total_seconds()
-        time_to_arrival = stop.time_to_arrival.total_seconds() if stop.time_to_arrival else stop.time_to.total_seconds()
+        now_ts = now.timestamp()
+        # a missing arrival/departure time falls back to the other one
+        state = self._compute_stop_state(
+            time_to_arrival=(arrival_ts if arrival_ts is not None else departure_ts) - now_ts,
+            time_to_departure=(departure_ts if departure_ts is not None else arrival_ts) - now_ts,
+            now=now)
 
-        if stop_type == StopType.ARRIVAL and self.has_arrived(stop=stop, time_to_arrival=time_to_arrival):
+        if stop.stop_type == StopType.ARRIVAL and self._has_arrived(stop, state):
             return "Arrived"
 
-        if self.has_departed(stop=stop,time_to_departure=time_to_departure):
+        if self._has_departed(stop, state):
             return "Departed"
 
-        if self.is_boarding(stop=stop, time_to_arrival=time_to_arrival, time_to_departure=time_to_departure):
+        if self._is_boarding(stop, state):
             return "Boarding"
 
-        if stop.arrival_time and self.is_arriving(stop=stop, time_to_arrival=time_to_arrival):
+        if arrival_ts is not None and self._is_arriving(stop, state):
             return "Arriving"
 
         # Default to formatted time countdown
-        return self._format_time(time_to_arrival) if time_to_arrival >= 30 else None
+        return self._format_time(state.time_to_arrival) if state.time_to_arrival >= 30 else None
 
-    def _get_stop_mbta_countdown(self, stop_type: StopType) -> Optional[str]:
-        """Determine the countdown to a stop based on vehicle and time following
-        https://www.mbta.com/developers/v3-api/best-practices """
-
-        stop = self.get_stop_by_type(stop_type)
-
-        if stop:
-
-            if stop.status:
-                return stop.status
+    def _compute_stop_mbta_countdown(self, stop: Stop, now: datetime) -> Optional[str]:
+        if stop.status:
+            return stop.status
 
-            if not stop.time:
-                return None
+        # stop time is the arrival time, or the departure time when there is no arrival
+        stop_ts = stop._arrival_ts if stop._arrival_ts is not None else stop._departure_ts
+        if stop_ts is None:
+            return None
 
-            seconds = stop.time_to.total_seconds()
+        seconds = stop_ts - now.timestamp()
 
-            if seconds < 0:
-                return None
+        if seconds < 0:
+            return None
 
-            if seconds <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE and self.mbta_vehicle and self.mbta_vehicle.current_stop_sequence == stop.stop_sequence and  self.mbta_vehicle.current_status == "STOPPED_AT":
+        if seconds <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE:
+            state = self._compute_stop_state(seconds, seconds)
+            if state.vehicle_stop == stop.stop_sequence and state.vehicle_status == "STOPPED_AT":
                 return "BRD"
-            
-            if seconds <= self.STOP_COUNTDOWN_THRESHOLD:
-                return "ARR"
 
-            if seconds <= 60:
-                return "1 min"
+        if seconds <= self.STOP_COUNTDOWN_THRESHOLD:
+            return "ARR"
 
-            minutes = int(seconds/60)
+        if seconds <= 60:
+            return "1 min"
 
-            if minutes > 20:
-                return "20+ min"
+        minutes = int(seconds/60)
 
-            return f"{minutes} min"
+        if minutes > 20:
+            return "20+ min"
 
-        return None
+        return _MIN_STRINGS[minutes]
 
-   # Convert seconds_to_arrival to human-readable format
-    def _format_time(self, seconds_to_arrival: int) -> Optional[str]:
+    # Convert seconds_to_arrival to human-readable format
+    @staticmethod
+    def _format_time(seconds_to_arrival: float) -> Optional[str]:
         if seconds_to_arrival < 0:
             return None
-        minutes = int((seconds_to_arrival // 60) % 60)
-        hours = int((seconds_to_arrival // 3600) % 24)
-        days = int(seconds_to_arrival // 86400)
-
-        if days > 0:
-            return f"{days}d {hours}h {minutes}m"
-        if hours > 0:
+        seconds = int(seconds_to_arrival)
+        # most countdowns are under an hour, check the cheapest tier first
+        if seconds < 3600:
+            return _MIN_STRINGS[seconds // 60]
+        if seconds < 86400:
+            hours, minutes = divmod(seconds // 60, 60)
             return f"{hours}h {minutes}m"
-        if minutes > 1:
-            return f"{minutes} min"
-        return "1 min"
-    
+        days, remainder = divmod(seconds, 86400)
+        hours, minutes = divmod(remainder // 60, 60)
+        return f"{days}d {hours}h {minutes}m"
+
     def has_departed(self, stop: Stop, time_to_departure: int, filtering_grace_period: Optional[int] = 0) -> bool:
         """
         Determines whether the transit has departed a given stop.
         """
-        #if vehicle data (for this use case we don't need to check freshness...)
-        if self.mbta_vehicle:
-            vehicle_stop = self.mbta_vehicle.current_stop_sequence
-            # if the vehicle stop is after the departure stop
-            if vehicle_stop > stop.stop_sequence:
-                # if filtering grace period
-                if filtering_grace_period > 0:
-                    return time_to_departure + filtering_grace_period <= 0
-                return True
-            
-        # If no fresh vehicle data, determine departure based on time threshold
-        return time_to_departure + filtering_grace_period <= 0
-
+        state = self._compute_stop_state(time_to_departure, time_to_departure)
+        return self._has_departed(stop, state, filtering_grace_period)
 
     def has_arrived(self, stop: Stop, time_to_arrival: int, filtering_grace_period: Optional[int] = 0) -> bool:
         """
         Determines whether the transit has arrived at a given stop.
         """
+        state = self._compute_stop_state(time_to_arrival, time_to_arrival)
+        return self._has_arrived(stop, state, filtering_grace_period)
 
-        #if vehicle data (for this use case we don't need to check freshness...)
-        if self.mbta_vehicle:
-            vehicle_stop = self.mbta_vehicle.current_stop_sequence
-            vehicle_status = self.mbta_vehicle.current_status
-            # if the vehicle is at or after the arrival stop
-            if vehicle_stop > stop.stop_sequence or (vehicle_stop == stop.stop_sequence and vehicle_status == "STOPPED_AT"):
-
-                if filtering_grace_period > 0:
-                    return time_to_arrival + filtering_grace_period <= 0
-                return True
-            
-        # If no fresh vehicle data, determine arrival based on time threshold
-        return time_to_arrival + filtering_grace_period <= 0
-
-
-    def is_boarding(self, stop: Stop, time_to_arrival: int, time_to_departure: int) -> bool:
+    def is_boarding(self, stop: Stop, time_to_arrival: int, time_to_departure: int, now: Optional[datetime] = None) -> bool:
         """
         Determines whether the transit is currently boarding at a given stop.
         """
-        # If live vehicle data is available
-        if self.mbta_vehicle:
-            vehicle_stop = self.mbta_vehicle.current_stop_sequence
-            vehicle_status = self.mbta_vehicle.current_status
+        state = self._compute_stop_state(time_to_arrival, time_to_departure, now or datetime.now(timezone.utc))
+        return self._is_boarding(stop, state)
 
-            if vehicle_stop == stop.stop_sequence and vehicle_status == "STOPPED_AT":
+    def is_arriving(self, stop: Stop, time_to_arrival: int, now: Optional[datetime] = None) -> bool:
+        """
+        Determines whether the transit is currently arriving at a given stop.
+        """
+        state = self._compute_stop_state(time_to_arrival, time_to_arrival, now or datetime.now(timezone.utc))
+        return self._is_arriving(stop, state)
+
+    @staticmethod
+    def _has_departed(stop: Stop, state: _StopState, filtering_grace_period: Optional[int] = 0) -> bool:
+        #if vehicle data (for this use case we don't need to check freshness...)
+        # if the vehicle stop is after the departure stop, unless filtering with a grace period
+        vehicle_stop = state.vehicle_stop
+        if vehicle_stop is not None and vehicle_stop > stop.stop_sequence and not filtering_grace_period > 0:
+            return True
+        # If no vehicle data, determine departure based on time threshold
+        return state.time_to_departure + filtering_grace_period <= 0
+
+    @staticmethod
+    def _has_arrived(stop: Stop, state: _StopState, filtering_grace_period: Optional[int] = 0) -> bool:
+        #if vehicle data (for this use case we don't need to check freshness...)
+        vehicle_stop = state.vehicle_stop
+        stop_sequence = stop.stop_sequence
+        # if the vehicle is at or after the arrival stop, unless filtering with a grace period
+        if vehicle_stop is not None and not filtering_grace_period > 0 and (
+            vehicle_stop > stop_sequence
+            or (vehicle_stop == stop_sequence and state.vehicle_status == "STOPPED_AT")):
+            return True
+        # If no vehicle data, determine arrival based on time threshold
+        return state.time_to_arrival + filtering_grace_period <= 0
+
+    def _is_boarding(self, stop: Stop, state: _StopState) -> bool:
+        time_to_departure = state.time_to_departure
+        vehicle_stop = state.vehicle_stop
+        # If vehicle data is available
+        if vehicle_stop is not None:
+            stop_sequence = stop.stop_sequence
+
+            if vehicle_stop == stop_sequence and state.vehicle_status == "STOPPED_AT":
+                vehicle_data_age = state.vehicle_data_age
+                if vehicle_data_age is None:
+                    return False
 
                 # Case 1: Live vehicle data, within the departure buffer
-                if self.is_vehicle_data_live and time_to_departure <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE:
+                if vehicle_data_age <= self._VEHICLE_DATA_LIVENESS_DELTA and time_to_departure <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE:
                     return True
 
-                # Case 2: Live vehicle data
-                if self.is_vehicle_data_fresh and self.VEHICLE_DATA_BOARDING_BUFFER_TIME_POST_DEPARTURE <= time_to_departure <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE:
-                    return True
-                else:
-                    return False  # Explicitly return False when conditions are not met
- 
-            elif vehicle_stop > stop.stop_sequence:
+                # Case 2: Fresh vehicle data, around the departure time
+                return (vehicle_data_age <= self._VEHICLE_DATA_FRESHNESS_DELTA
+                        and self.VEHICLE_DATA_BOARDING_BUFFER_TIME_POST_DEPARTURE <= time_to_departure <= self.VEHICLE_DATA_BOARDING_BUFFER_TIME_PRE_DEPARTURE)
+
+            if vehicle_stop > stop_sequence:
                 return False
-            
-        # If no vehicle data, rely strictly on schedule-based conditions
-        return (time_to_arrival < 0 <= time_to_departure) and (0 <= time_to_departure <= self.STOP_COUNTDOWN_THRESHOLD)
 
-    def is_arriving(self, stop: Stop, time_to_arrival: int) -> bool:
-        """
-        Determines whether the transit is currently arriving at a given stop.
-        """
+        # If no vehicle data, rely strictly on schedule-based conditions
+        return (state.time_to_arrival < 0 <= time_to_departure) and (0 <= time_to_departure <= self.STOP_COUNTDOWN_THRESHOLD)
 
+    def _is_arriving(self, stop: Stop, state: _StopState) -> bool:
+        time_to_arrival = state.time_to_arrival
+        vehicle_stop = state.vehicle_stop
+        vehicle_data_age = state.vehicle_data_age
         # If live vehicle data is available
-        if self.mbta_vehicle and self.is_vehicle_data_live:
-            vehicle_stop = self.mbta_vehicle.current_stop_sequence
-            vehicle_status = self.mbta_vehicle.current_status
-
+        if vehicle_stop is not None and vehicle_data_age is not None and vehicle_data_age <= self._VEHICLE_DATA_LIVENESS_DELTA:
             # If vehicle is approaching the stop
-            if vehicle_stop == stop.stop_sequence and vehicle_status == "INCOMING_AT":
-                return True
-            elif vehicle_stop == stop.stop_sequence and vehicle_status == "IN_TRANSIT_TO" and -self.STOP_COUNTDOWN_THRESHOLD < time_to_arrival < self.STOP_COUNTDOWN_THRESHOLD:
-                return True
-            else:
+            if vehicle_stop != stop.stop_sequence:
                 return False
+            vehicle_status = state.vehicle_status
+            return vehicle_status == "INCOMING_AT" or (
+                vehicle_status == "IN_TRANSIT_TO" and -self.STOP_COUNTDOWN_THRESHOLD < time_to_arrival < self.STOP_COUNTDOWN_THRESHOLD)
 
-        # If no vehicle data, rely strictly on schedule, arrival within the th
-        return  0 <= time_to_arrival <= self.STOP_COUNTDOWN_THRESHOLD
+        # If no vehicle data, rely strictly on schedule, arrival within the threshold
+        return 0 <= time_to_arrival <= self.STOP_COUNTDOWN_THRESHOLD
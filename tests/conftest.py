@@ -0,0 +1,57 @@
+import asyncio
+import os
+
+import pytest_asyncio
+from dotenv import load_dotenv
+
+from src.mbtaclient.client.mbta_client import MBTAClient
+from src.mbtaclient.client.mbta_cache_manager import MBTACacheManager
+
+# Load .env file and access the token once per test session
+load_dotenv()
+API_KEY = os.getenv("API_KEY")
+
+# In-flight requests allowed on the shared client, kept under the MBTA rate limit when cases run concurrently
+MAX_CONCURRENT_REQUESTS = 10
+# Requests issued per second, slightly below the MBTA quota for an API key (1000 per minute)
+MAX_REQUESTS_PER_SECOND = 15
+
+
+class _RequestRateLimiter:
+    """Spaces the requests evenly so the tests stay under the quota instead of backing off on HTTP 429."""
+
+    def __init__(self, max_rate: float):
+        self._interval = 1 / max_rate
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        now = asyncio.get_running_loop().time()
+        # reserve the next free slot before waiting, so concurrent callers queue up behind it
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mbta_client():
+    """
+    MBTAClient shared by all the integration tests of the session, so the
+    handler cases reuse the same HTTP session and cache.
+    """
+    cache_manager = MBTACacheManager(requests_per_stats_report=10)
+    async with MBTAClient(
+        cache_manager=cache_manager, api_key=API_KEY, max_concurrent_requests=MAX_CONCURRENT_REQUESTS
+    ) as client:
+        limiter = _RequestRateLimiter(MAX_REQUESTS_PER_SECOND)
+        request = client.request
+
+        async def rate_limited_request(*args, **kwargs):
+            async with limiter:
+                return await request(*args, **kwargs)
+
+        client.request = rate_limited_request
+        yield client
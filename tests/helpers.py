@@ -0,0 +1,64 @@
+import time
+from datetime import datetime
+from functools import cache
+from inspect import isdatadescriptor
+from typing import Optional
+
+from src.mbtaclient.stop import StopType
+from src.mbtaclient.trip import Trip
+
+# Trip properties printed for each trip, collected once
+TRIP_DATA_DESCRIPTORS = tuple(attr for attr in dir(Trip) if isdatadescriptor(getattr(Trip, attr)))
+
+
+def fake_fetch_data(responses: dict[str, dict]):
+    """Return a MBTAClient._fetch_data replacement serving the canned responses by path."""
+
+    async def fetch_data(path: str, params: Optional[dict] = None):
+        return responses[path], time.time_ns()
+
+    return fetch_data
+
+
+@cache
+def parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the mock data, once per distinct string."""
+    return datetime.fromisoformat(value)
+
+
+def check_trip(trip: Trip, now: float, departure_stop_name: str, arrival_stop_name: Optional[str] = None) -> None:
+    """
+    Validates the essential properties of a trip returned by a handler and prints its details for debugging.
+
+    Args:
+        trip (Trip): The trip to check.
+        now (float): The current POSIX timestamp, taken once for all the trips of a case.
+        departure_stop_name (str): Name of the departure stop.
+        arrival_stop_name (str): Name of the arrival stop, if any.
+    """
+    stops = f"{departure_stop_name} or {arrival_stop_name}" if arrival_stop_name else departure_stop_name
+
+    # Validate essential trip properties
+    assert trip.mbta_route is not None, f"Trip is missing route information for {stops}"
+    assert trip.mbta_trip is not None, f"Trip is missing trip information for {stops}"
+    assert trip.departure_time is not None, f"Trip is missing departure time for {stops}"
+
+    # Route type-specific validations
+    if trip.mbta_route.type in [1, 2]:  # Heavy Rail or Commuter Rail
+        assert trip.departure_platform is not None, (
+            f"Rail trip at stop {departure_stop_name} must have a platform name."
+        )
+
+    # Print trip details for debugging
+    for property_name in TRIP_DATA_DESCRIPTORS:
+        print(f"trip.{property_name}: {getattr(trip, property_name)}")
+
+    # Calculate time deltas from the departure stop times (a missing time falls back to the other one)
+    departure_stop = trip.get_stop_by_type(StopType.DEPARTURE)
+    arrival_time = departure_stop.arrival_time or departure_stop.departure_time
+    departure_time = departure_stop.departure_time or departure_stop.arrival_time
+
+    print(f"seconds_arrival: {int(arrival_time.timestamp() - now)}")
+    print(f"seconds_departure: {int(departure_time.timestamp() - now)}")
+
+    print("##############")
@@ -1,5 +1,18 @@
 # mock_data.py
 
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Optional
+
+
+def _freeze(data):
+    """Wrap the mock dicts, nested ones included, in read-only mapping proxies."""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return [_freeze(item) for item in data]
+    return data
+
 VALID_ROUTE_RESPONSE_DATA = {
     "id": "Red",
     "type": "route",
@@ -221,4 +234,105 @@ VALID_ALERT_RESPONSE_DATA = {
     "type": "alert"
 }
 
+# shared across tests, read-only so a test can't leak changes into the others
+VALID_ROUTE_RESPONSE_DATA = _freeze(VALID_ROUTE_RESPONSE_DATA)
+VALID_TRIP_RESPONSE_DATA = _freeze(VALID_TRIP_RESPONSE_DATA)
+VALID_STOP_RESPONSE_DATA = _freeze(VALID_STOP_RESPONSE_DATA)
+VALID_SCHEDULE_RESPONSE_DATA = _freeze(VALID_SCHEDULE_RESPONSE_DATA)
+VALID_PREDICTION_RESPONSE_DATA = _freeze(VALID_PREDICTION_RESPONSE_DATA)
+VALID_ALERT_RESPONSE_DATA = _freeze(VALID_ALERT_RESPONSE_DATA)
+
 
+def handler_responses(now: datetime) -> dict[str, dict]:
+    """
+    Canned MBTA API responses, keyed by path, for the handler tests: commuter rail
+    train 518 from West Natick to South Station, departing 10 minutes after `now`.
+    """
+    def at(minutes: int) -> str:
+        return (now + timedelta(minutes=minutes)).isoformat()
+
+    route = {
+        "id": "CR-Worcester",
+        "type": "route",
+        "attributes": {
+            "color": "80276C",
+            "direction_destinations": ["Worcester", "South Station"],
+            "direction_names": ["Outbound", "Inbound"],
+            "long_name": "Framingham/Worcester Line",
+            "short_name": "",
+            "type": 2
+        }
+    }
+    trip = {
+        "id": "CR-518",
+        "type": "trip",
+        "attributes": {"direction_id": 1, "headsign": "South Station", "name": "518"},
+        "relationships": {"route": {"data": {"id": "CR-Worcester", "type": "route"}}}
+    }
+    stops = [
+        {"id": "WML-0147-02", "type": "stop", "attributes": {"name": "West Natick", "platform_name": "Inbound"}},
+        {"id": "NEC-2287-05", "type": "stop", "attributes": {"name": "South Station", "platform_name": "Track 5"}},
+    ]
+
+    def scheduling(type: str, stop_id: str, stop_sequence: int, arrival: Optional[str], departure: Optional[str]) -> dict:
+        return {
+            "id": f"{type}-CR-518-{stop_id}-{stop_sequence}",
+            "type": type,
+            "attributes": {
+                "arrival_time": arrival,
+                "departure_time": departure,
+                "direction_id": 1,
+                "schedule_relationship": None,
+                "status": None,
+                "stop_sequence": stop_sequence
+            },
+            "relationships": {
+                "route": {"data": {"id": "CR-Worcester", "type": "route"}},
+                "stop": {"data": {"id": stop_id, "type": "stop"}},
+                "trip": {"data": {"id": "CR-518", "type": "trip"}}
+            }
+        }
+
+    return {
+        "stops": {"data": stops},
+        "trips": {"data": [trip]},
+        "trips/CR-518": {"data": trip},
+        "routes/CR-Worcester": {"data": route},
+        "schedules": {
+            "data": [
+                scheduling("schedule", "WML-0147-02", 10, at(10), at(10)),
+                scheduling("schedule", "NEC-2287-05", 60, at(40), None),
+            ],
+            "included": [route, trip]
+        },
+        "predictions": {
+            "data": [scheduling("prediction", "WML-0147-02", 10, at(12), at(12))],
+            "included": [route, trip]
+        },
+        "vehicles": {
+            "data": [{
+                "id": "1710",
+                "type": "vehicle",
+                "attributes": {"current_status": "IN_TRANSIT_TO", "current_stop_sequence": 8, "updated_at": now.isoformat()},
+                "relationships": {
+                    "route": {"data": {"id": "CR-Worcester", "type": "route"}},
+                    "stop": {"data": {"id": "WML-0147-02", "type": "stop"}},
+                    "trip": {"data": {"id": "CR-518", "type": "trip"}}
+                }
+            }]
+        },
+        "alerts": {
+            "data": [{
+                "id": "alert-518",
+                "type": "alert",
+                "attributes": {
+                    "active_period": [{"start": at(-60), "end": None}],
+                    "effect": "DELAY",
+                    "header": "Train 518 is running 2 minutes late.",
+                    "informed_entity": [{"route": "CR-Worcester", "route_type": 2, "trip": "CR-518", "activities": ["BOARD", "EXIT"]}],
+                    "severity": 5,
+                    "short_header": "Train 518 delayed"
+                }
+            }]
+        },
+    }
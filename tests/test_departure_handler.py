@@ -1,16 +1,41 @@
+import time
 from datetime import datetime
-from inspect import isdatadescriptor
+from unittest.mock import patch
+
 import pytest
-from dotenv import load_dotenv
-import os
 
-from src.mbtaclient.trip import Trip
 from src.mbtaclient.client.mbta_client import MBTAClient
-from src.mbtaclient.client.mbta_cache_manager import MBTACacheManager
 from src.mbtaclient.handlers.departures_handler import DeparturesHandler
+from tests.helpers import check_trip, fake_fetch_data
+from tests.mock_data import handler_responses
 
 
 @pytest.mark.asyncio
+async def test_handler_offline():
+    """Tests DeparturesHandler end to end against canned MBTA API responses."""
+
+    async with MBTAClient() as client:
+        with patch.object(client, '_fetch_data', side_effect=fake_fetch_data(handler_responses(datetime.now().astimezone()))):
+            handler: DeparturesHandler = await DeparturesHandler.create(
+                departure_stop_name="West Natick",
+                mbta_client=client,
+                max_trips=1
+            )
+            trips = await handler.update()
+
+    assert len(trips) == 1
+    trip = trips[0]
+    check_trip(trip, time.time(), "West Natick")
+    assert trip.headsign == "South Station"
+    assert trip.departure_platform == "Inbound"
+    assert trip.arrival_stop_name is None
+    assert trip.departure_countdown == "11 min"
+    assert trip.alerts == {"DELAY: Train 518 delayed"}
+
+
+# Integration tests against the live MBTA API
+@pytest.mark.live
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.parametrize(
     "stop_name, route_type",
     [
@@ -24,7 +49,7 @@ from src.mbtaclient.handlers.departures_handler import DeparturesHandler
         ("Park Street", "Heavy Rail + Light Rail"),
     ]
 )
-async def test_handler(stop_name, route_type):
+async def test_handler(mbta_client, stop_name, route_type):
     """
     Integration test for TimetableHandler for different route types.
     Ensures that trips are correctly retrieved and processed for various stops and route types.
@@ -33,69 +58,22 @@ async def test_handler(stop_name, route_type):
         stop_name (str): Name of the stop to test.
         route_type (str): Type of the route (e.g., train, ferry, bus).
     """
-    # Load .env file
-    load_dotenv()
-
-    # Access the token
-    API_KEY = os.getenv("API_KEY")
-
-    # Initialize MBTA Cache Manager and Client
-    cache_manager = MBTACacheManager(requests_per_stats_report=10)
-    async with MBTAClient(cache_manager=cache_manager, api_key=API_KEY) as mbta_client:
-        
-        print(f"Testing TimetableHandler for stop: {stop_name} ({route_type})")
-        
-        # Configure the handler for the given stop
-        max_trips = 1  # Limit the number of trips to process
-        handler: DeparturesHandler = await DeparturesHandler.create(
-            departure_stop_name=stop_name,
-            mbta_client=mbta_client,
-            max_trips=max_trips
-        )
-        
-        # Fetch trips using the handler
-        trips = await handler.update()
-        trips = await handler.update()
-        # Assertions to verify handler functionality
-        assert trips is not None, f"No trips returned for stop: {stop_name}"
-        assert len(trips) <= max_trips, f"More trips than expected for stop: {stop_name}"
-        
-        for trip in trips:
-            # Validate essential trip properties
-            assert trip.mbta_route is not None, f"Trip is missing route information for {stop_name}"
-            assert trip.mbta_trip is not None, f"Trip is missing trip information for {stop_name}"
-            assert trip.departure_time is not None, f"Trip is missing departure time for {stop_name}"
-            
-            # Route type-specific validations
-            if trip.mbta_route.type in [1, 2]:  # Heavy Rail or Commuter Rail
-                assert trip.departure_platform is not None, (
-                    f"Rail trip at stop {stop_name} must have a platform name."
-                )
-            
-            # # Ensure trips belong to the expected route type
-            # assert any(route_type_part in trip.route_description for route_type_part in route_type.split(" + ")), (
-            #     f"Route type mismatch for stop: {stop_name}. "
-            #     f"Expected one of {route_type}, but got {trip.route_description}."
-            # )
-            
-            # Print trip details for debugging
-            properties = [attr for attr in dir(Trip) if isdatadescriptor(getattr(Trip, attr))]
-            for property_name in properties:
-                print(f"trip.{property_name}: {getattr(trip, property_name)}")
-                               
-            now = datetime.now().astimezone()
-
-            # Calculate time deltas
-            arrival_time = trip._departure_stop.arrival_time or trip._departure_stop.time
-            departure_time = trip._departure_stop.departure_time or trip._departure_stop.time
-
-            arrival_delta = arrival_time.astimezone() - now
-            departure_delta = departure_time.astimezone() - now
+    print(f"Testing TimetableHandler for stop: {stop_name} ({route_type})")
+    
+    # Configure the handler for the given stop
+    max_trips = 1  # Limit the number of trips to process
+    handler: DeparturesHandler = await DeparturesHandler.create(
+        departure_stop_name=stop_name,
+        mbta_client=mbta_client,
+        max_trips=max_trips
+    )
+    
+    # Fetch trips using the handler
+    trips = await handler.update()
+    # Assertions to verify handler functionality
+    assert trips is not None, f"No trips returned for stop: {stop_name}"
+    assert len(trips) <= max_trips, f"More trips than expected for stop: {stop_name}"
 
-            seconds_arrival = int(arrival_delta.total_seconds())
-            seconds_departure = int(departure_delta.total_seconds())
-            
-            print(f"seconds_arrival: {seconds_arrival}")
-            print(f"seconds_departure: {seconds_departure}")
-         
-            print("##############") 
\ No newline at end of file
+    now = time.time()
+    for trip in trips:
+        check_trip(trip, now, stop_name)
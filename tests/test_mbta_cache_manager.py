@@ -0,0 +1,21 @@
+from unittest.mock import patch
+
+from src.mbtaclient.client.mbta_cache_manager import MBTACacheManager
+from src.mbtaclient.handlers.base_handler import MBTABaseHandler
+
+
+def test_update_cache_same_second():
+    """Tests that two updates within the same second are told apart by their timestamps."""
+
+    cache_manager = MBTACacheManager()
+    same_second_ns = (1_700_000_000_100_000_000, 1_700_000_000_900_000_000)
+
+    with patch("src.mbtaclient.client.mbta_cache_manager.time.time_ns", side_effect=same_second_ns):
+        first = cache_manager.update_cache(path="schedules", params=None, data=["old"])
+        second = cache_manager.update_cache(path="schedules", params=None, data=["new"])
+
+    assert first < second
+    assert cache_manager.get_cached_data(path="schedules", params=None) == (["new"], second, None)
+    # the newer fetch of the same second is processed again
+    assert MBTABaseHandler._should_reprocess(first, second)
+    assert not MBTABaseHandler._should_reprocess(second, second)
@@ -10,6 +10,8 @@ from src.mbtaclient.models.mbta_stop import MBTAStop
 from src.mbtaclient.models.mbta_schedule import MBTASchedule
 from src.mbtaclient.models.mbta_prediction import MBTAPrediction
 from src.mbtaclient.models.mbta_alert import MBTAAlert
+from src.mbtaclient.mbta_object_store import MBTARouteObjStore, MBTATripObjStore
+from tests.mock_data import VALID_ROUTE_RESPONSE_DATA, VALID_TRIP_RESPONSE_DATA
 
 @pytest.mark.asyncio
 async def test_fetch_route():
@@ -73,6 +75,24 @@ async def test_fetch_schedules():
             mock_method.assert_called_once_with(ENDPOINTS["SCHEDULES"], None)
 
 
+@pytest.mark.asyncio
+async def test_fetch_schedules_stores_included():
+    async def mock_fetch_data(path, params):
+        return {
+            "data": [{"id": "schedule-1"}],
+            "included": [VALID_ROUTE_RESPONSE_DATA, VALID_TRIP_RESPONSE_DATA]
+        }, 0.0
+
+    MBTARouteObjStore.clear_store()
+    MBTATripObjStore.clear_store()
+    async with MBTAClient() as client:
+        with patch.object(client, '_fetch_data', side_effect=mock_fetch_data):
+            schedules, _ = await client.fetch_schedules({'include': 'trip,route'})
+            assert len(schedules) == 1
+            assert MBTARouteObjStore.get_by_id(VALID_ROUTE_RESPONSE_DATA["id"]) is not None
+            assert MBTATripObjStore.get_by_id(VALID_TRIP_RESPONSE_DATA["id"]) is not None
+
+
 @pytest.mark.asyncio
 async def test_fetch_predictions():
     async def mock_fetch_data(path, params):
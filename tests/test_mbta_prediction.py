@@ -1,6 +1,6 @@
-from datetime import datetime
 from src.mbtaclient.models.mbta_prediction import MBTAPrediction  # Adjust import path as per your project structure
 from tests.mock_data import VALID_PREDICTION_RESPONSE_DATA  # Mock data import
+from tests.helpers import parse_iso
 
 def test_mbta_prediction_init():
     """Tests that MBTAPrediction is initialized correctly with the prediction data."""
@@ -13,11 +13,11 @@ def test_mbta_prediction_init():
     arrival_time = VALID_PREDICTION_RESPONSE_DATA.get("attributes", {}).get("arrival_time")
     departure_time = VALID_PREDICTION_RESPONSE_DATA.get("attributes", {}).get("departure_time")
     if arrival_time:
-        assert prediction.arrival_time == datetime.fromisoformat(arrival_time)
+        assert prediction.arrival_time == parse_iso(arrival_time)
     else:
         assert prediction.arrival_time is None
     if departure_time:
-        assert prediction.departure_time == datetime.fromisoformat(departure_time)
+        assert prediction.departure_time == parse_iso(departure_time)
     else:
         assert prediction.departure_time is None 
     assert prediction.direction_id == VALID_PREDICTION_RESPONSE_DATA.get("attributes", {}).get("direction_id")
@@ -42,7 +42,17 @@ def test_mbta_prediction_init():
     assert prediction.route_id == (
         VALID_PREDICTION_RESPONSE_DATA.get("relationships", {}).get("route", {}).get("data", {}).get("id")
     )
+    assert prediction.alerts_id == []
 
+    # Alert relationships without an id are skipped
+    prediction = MBTAPrediction({
+        **VALID_PREDICTION_RESPONSE_DATA,
+        "relationships": {
+            **VALID_PREDICTION_RESPONSE_DATA["relationships"],
+            "alerts": {"data": [{"id": None, "type": "alert"}, {"type": "alert"}, {"id": "626462", "type": "alert"}]}
+        }
+    })
+    assert prediction.alerts_id == ["626462"]
 
     # Confirm the __repr__ method includes key identifying attributes
     repr_string = repr(prediction)
@@ -1,9 +1,9 @@
-from datetime import datetime
 import pytest
 from typing import Dict
 
 from src.mbtaclient.models.mbta_schedule import MBTASchedule
 from tests.mock_data import VALID_SCHEDULE_RESPONSE_DATA  # Direct import
+from tests.helpers import parse_iso
 
 def test_mbta_schedule_init():
     """Tests that MBTASchedule is initialized correctly with or without data."""
@@ -15,11 +15,11 @@ def test_mbta_schedule_init():
     arrival_time = VALID_SCHEDULE_RESPONSE_DATA.get("attributes", {}).get("arrival_time")
     departure_time = VALID_SCHEDULE_RESPONSE_DATA.get("attributes", {}).get("departure_time")
     if arrival_time:
-        assert schedule.arrival_time == datetime.fromisoformat(arrival_time)
+        assert schedule.arrival_time == parse_iso(arrival_time)
     else:
         assert schedule.arrival_time is None
     if departure_time:
-        assert schedule.departure_time == datetime.fromisoformat(departure_time)
+        assert schedule.departure_time == parse_iso(departure_time)
     else:
         assert schedule.departure_time is None 
     assert schedule.direction_id == VALID_SCHEDULE_RESPONSE_DATA.get("attributes", {}).get("direction_id", 0)
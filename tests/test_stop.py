@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+from src.mbtaclient.stop import Stop, StopType
+from src.mbtaclient.mbta_object_store import MBTAStopObjStore
+from src.mbtaclient.models.mbta_stop import MBTAStop
+
+
+def test_stop_times():
+    """Tests that the stop time, delay and timestamps follow the stop updates."""
+
+    scheduled = datetime.fromisoformat("2025-01-01T10:00:00-05:00")
+    stop = Stop(stop_type=StopType.DEPARTURE, mbta_stop_id="place-alfcl", stop_sequence=1, departure_time=scheduled)
+
+    assert not hasattr(stop, "__dict__") and not hasattr(stop.departure, "__dict__")
+    assert repr(stop) == "TripStop(departure): place-alfcl @ 2025-01-01 10:00:00"
+    assert StopType("departure") is StopType.DEPARTURE and StopType.ARRIVAL.value == "arrival"
+    assert stop.time == scheduled
+    assert stop.arrival_time is None
+    assert stop.departure_time == scheduled
+    assert stop.deltatime is None
+    assert stop._arrival_ts is None
+    assert stop._departure_ts == scheduled.timestamp()
+
+    predicted = scheduled + timedelta(minutes=2)
+    stop.update_stop(mbta_stop_id="place-alfcl", stop_sequence=1, departure_time=predicted)
+
+    assert stop.time == predicted
+    assert stop.deltatime == timedelta(minutes=2)
+    assert stop._departure_ts == predicted.timestamp()
+
+    # The arrival time takes precedence once the stop has one
+    arrival = scheduled - timedelta(minutes=1)
+    stop.update_stop(mbta_stop_id="place-alfcl", stop_sequence=1, arrival_time=arrival)
+
+    assert stop.time == arrival
+    assert stop.deltatime == timedelta(minutes=2)
+    assert stop._arrival_ts == arrival.timestamp()
+
+
+def test_stop_time_to():
+    """Tests the time left to aware and naive stop times, naive ones being local times."""
+
+    in_ten_minutes = datetime.now().astimezone() + timedelta(minutes=10)
+    aware = Stop(stop_type=StopType.DEPARTURE, mbta_stop_id="place-alfcl", stop_sequence=1, departure_time=in_ten_minutes)
+    naive = Stop(stop_type=StopType.ARRIVAL, mbta_stop_id="place-alfcl", stop_sequence=1, arrival_time=in_ten_minutes.replace(tzinfo=None))
+
+    for time_to in (aware.time_to, aware.time_to_departure, naive.time_to, naive.time_to_arrival):
+        assert timedelta(minutes=9) < time_to <= timedelta(minutes=10)
+    assert aware.time_to_arrival is None
+    assert naive.time_to_departure is None
+
+
+def test_stop_mbta_stop():
+    """Tests that the MBTAStop is resolved from the registry and follows stop id changes."""
+
+    alewife = MBTAStop({"id": "place-alfcl", "attributes": {"name": "Alewife"}})
+    davis = MBTAStop({"id": "place-davis", "attributes": {"name": "Davis"}})
+    MBTAStopObjStore.store(alewife)
+    MBTAStopObjStore.store(davis)
+
+    stop = Stop(stop_type=StopType.ARRIVAL, mbta_stop_id="place-unknown", stop_sequence=1)
+    assert stop.mbta_stop is None
+
+    stop.update_stop(mbta_stop_id=alewife.id, stop_sequence=1)
+    assert stop.mbta_stop is alewife
+
+    stop.mbta_stop = davis
+    assert stop.mbta_stop_id == davis.id
+    assert stop.mbta_stop is davis
+
+    # Re-assigning the registered stop does not touch the registry
+    assert MBTAStopObjStore.is_stored(davis)
+    assert not MBTAStopObjStore.is_stored(MBTAStop({"id": davis.id}))
+    MBTAStopObjStore.store(alewife)
+    stop.mbta_stop = davis
+    assert next(reversed(MBTAStopObjStore._registry)) == alewife.id
+    assert stop.mbta_stop is davis
+
+    # Stops are resolved together, the ones already resolved are left untouched
+    stops = [
+        Stop(stop_type=StopType.DEPARTURE, mbta_stop_id=alewife.id, stop_sequence=1),
+        Stop(stop_type=StopType.ARRIVAL, mbta_stop_id="place-unknown", stop_sequence=2),
+        stop,
+    ]
+    Stop.resolve_many(stops)
+    assert [s.mbta_stop for s in stops] == [alewife, None, davis]
@@ -0,0 +1,228 @@
+from datetime import datetime, timedelta
+
+from src.mbtaclient.trip import Trip
+from src.mbtaclient.stop import StopType
+from src.mbtaclient.mbta_object_store import MBTARouteObjStore, MBTAStopObjStore
+from src.mbtaclient.models.mbta_alert import MBTAAlert
+from src.mbtaclient.models.mbta_route import MBTARoute
+from src.mbtaclient.models.mbta_stop import MBTAStop
+from src.mbtaclient.models.mbta_trip import MBTATrip
+from src.mbtaclient.models.mbta_vehicle import MBTAVehicle
+from src.mbtaclient.models.mbta_schedule import MBTASchedule
+from tests.mock_data import VALID_ALERT_RESPONSE_DATA, VALID_ROUTE_RESPONSE_DATA, VALID_SCHEDULE_RESPONSE_DATA, VALID_TRIP_RESPONSE_DATA  # Direct import
+
+
+def test_trip_stops():
+    """Tests that departure/arrival stops are tracked when stops are added, removed and reset."""
+
+    schedule = MBTASchedule(VALID_SCHEDULE_RESPONSE_DATA)
+    MBTAStopObjStore.store(MBTAStop({"id": schedule.stop_id}))
+
+    trip = Trip()
+    assert not hasattr(trip, "__dict__")  # slotted, caches are declared fields
+    assert trip._departure_stop is None
+    assert trip._arrival_stop is None
+
+    trip.add_stop(stop_type=StopType.DEPARTURE, scheduling=schedule, mbta_stop_id=schedule.stop_id)
+    departure_stop = trip.get_stop_by_type(StopType.DEPARTURE)
+    assert departure_stop is not None
+    assert trip._departure_stop is departure_stop
+    assert trip._arrival_stop is None
+    assert trip.departure_time == schedule.departure_time.replace(tzinfo=None)
+    assert trip.get_stops_ids() == [schedule.stop_id]
+
+    # Updating the stop keeps the same Stop object
+    trip.add_stop(stop_type=StopType.DEPARTURE, scheduling=schedule, mbta_stop_id=schedule.stop_id)
+    assert trip._departure_stop is departure_stop
+    assert len(trip.stops) == 1
+
+    # Removing an unknown id is a no-op, also for stops missing from the store
+    trip.add_stop(stop_type=StopType.ARRIVAL, scheduling=schedule, mbta_stop_id="not-in-store")
+    trip.remove_stop_by_id("unknown")
+    assert len(trip.stops) == 2
+    trip.remove_stop_by_id("not-in-store")
+    assert trip._arrival_stop is None
+
+    trip.remove_stop_by_id(schedule.stop_id)
+    assert trip._departure_stop is None
+    assert trip.stops == []
+
+    trip.add_stop(stop_type=StopType.ARRIVAL, scheduling=schedule, mbta_stop_id=schedule.stop_id)
+    assert trip._arrival_stop is not None
+    trip.reset_stops()
+    assert trip._arrival_stop is None
+    assert trip.get_stops_ids() == []
+
+
+def test_trip_mbta_route():
+    """Tests that the MBTARoute is resolved from the registry and follows route id changes."""
+
+    route = MBTARoute(VALID_ROUTE_RESPONSE_DATA)
+    other_route = MBTARoute({"id": "Orange"})
+    MBTARouteObjStore.store(other_route)
+
+    trip = Trip()
+    assert trip.mbta_route is None
+
+    trip.mbta_route = route
+    assert trip.mbta_route is route
+    assert MBTARouteObjStore.get_by_id(route.id) is route
+
+    # Setting the id directly resolves the new route from the registry
+    trip._mbta_route_id = other_route.id
+    assert trip.mbta_route is other_route
+
+    # A fresh route stored under the same id is picked up once the caches are reset
+    fresh_route = MBTARoute({"id": "Orange"})
+    MBTARouteObjStore.store(fresh_route)
+    assert trip.mbta_route is other_route
+    trip.reset_registry_caches()
+    assert trip.mbta_route is fresh_route
+
+
+def test_trip_route_details():
+    """Tests the route/trip derived properties, including direction_id 0."""
+
+    trip = Trip()
+    trip.mbta_route = MBTARoute(VALID_ROUTE_RESPONSE_DATA)
+    trip.mbta_trip = MBTATrip(VALID_TRIP_RESPONSE_DATA)
+
+    assert trip.route_name == "Red Line"
+    assert trip.route_color == f"#{trip.mbta_route.color}"
+    assert trip.headsign == trip.mbta_trip.headsign
+    assert trip.route_description == MBTARoute.get_route_type_desc_by_type_id(trip.mbta_route.type)
+    assert trip.destination == "Alewife"
+    assert trip.direction == "North"
+
+    trip.mbta_trip = MBTATrip({"id": "66715084", "attributes": {"direction_id": 0}})
+    assert trip.destination == "Ashmont/Braintree"
+    assert trip.direction == "South"
+
+
+def test_trip_alerts():
+    """Tests that alerts are resolved from the registry and formatted."""
+
+    mbta_alert = MBTAAlert(VALID_ALERT_RESPONSE_DATA)
+
+    trip = Trip()
+    assert trip.alerts is None
+
+    trip.mbta_alerts = [mbta_alert, MBTAAlert({"id": None})]
+    # Alerts are registered on first access
+    assert trip._mbta_alerts_ids == set()
+    assert trip.mbta_alerts == [mbta_alert]
+    assert trip._mbta_alerts_ids == {mbta_alert.id}
+    alerts = trip.alerts
+    assert alerts == {f"STATION ISSUE: {mbta_alert.short_header}"}
+    # The formatted alerts are reused until new alerts are set
+    assert trip.alerts is alerts
+    trip.mbta_alerts = [mbta_alert]
+    assert trip.alerts is not alerts
+    assert trip.alerts == alerts
+    assert trip.get_alert_header(0) == mbta_alert.header
+    assert trip.get_alert_header(1) is None
+
+    # Distinct alerts with the same effect and header are listed once
+    trip.mbta_alerts = [MBTAAlert({**VALID_ALERT_RESPONSE_DATA, "id": "other-alert"})]
+    assert len(trip.mbta_alerts) == 2
+    assert trip.alerts == {f"STATION ISSUE: {mbta_alert.short_header}"}
+
+
+def test_trip_alerts_set_repeatedly():
+    """Tests that setting the same alerts on every poll doesn't pile them up."""
+
+    mbta_alert = MBTAAlert(VALID_ALERT_RESPONSE_DATA)
+
+    trip = Trip()
+    for _ in range(3):
+        trip.mbta_alerts = [mbta_alert]
+    assert len(trip._pending_alerts) == 1
+    assert trip.mbta_alerts == [mbta_alert]
+    assert trip.alerts == {f"STATION ISSUE: {mbta_alert.short_header}"}
+
+    trip.mbta_alerts = [mbta_alert]
+    trip.mbta_alerts = [mbta_alert]
+    assert trip.mbta_alerts == [mbta_alert]
+    assert trip.alerts == {f"STATION ISSUE: {mbta_alert.short_header}"}
+
+
+def test_trip_countdown():
+    """Tests the stop countdowns against a given current time."""
+
+    schedule = MBTASchedule(VALID_SCHEDULE_RESPONSE_DATA)
+
+    trip = Trip()
+    trip.add_stop(stop_type=StopType.DEPARTURE, scheduling=schedule, mbta_stop_id=schedule.stop_id)
+
+    now = schedule.departure_time - timedelta(minutes=10)
+    assert trip._get_stop_countdown(StopType.DEPARTURE, now=now) == "10 min"
+    assert trip._get_stop_mbta_countdown(StopType.DEPARTURE, now=now) == "10 min"
+
+    now = schedule.departure_time + timedelta(minutes=1)
+    assert trip._get_stop_countdown(StopType.DEPARTURE, now=now) == "Departed"
+    assert trip._get_stop_mbta_countdown(StopType.DEPARTURE, now=now) is None
+    assert trip._get_stop_countdown(StopType.ARRIVAL, now=now) is None
+
+    # Live vehicle data stopped at the stop overrides the schedule
+    now = schedule.departure_time - timedelta(minutes=1)
+    trip.mbta_vehicle = MBTAVehicle({
+        "id": "R-5480A18A",
+        "attributes": {
+            "current_status": "STOPPED_AT",
+            "current_stop_sequence": schedule.stop_sequence,
+            "updated_at": now.isoformat()
+        },
+        "relationships": {"trip": {"data": None}, "stop": {"data": None}, "route": {"data": None}}
+    })
+    assert trip._get_stop_countdown(StopType.DEPARTURE, now=now) == "Boarding"
+    assert trip._get_stop_mbta_countdown(StopType.DEPARTURE, now=now) == "BRD"
+    assert not trip.has_departed(trip.get_stop_by_type(StopType.DEPARTURE), time_to_departure=60)
+
+    # Memoized countdowns are dropped when the stops change
+    assert trip.departure_countdown == "Departed"
+    trip.reset_stops()
+    assert trip._get_stop_countdown(StopType.DEPARTURE) is None
+
+
+def test_trip_format_time():
+    """Tests the human-readable countdown format."""
+
+    assert Trip._format_time(-1) is None
+    assert Trip._format_time(59.9) == "1 min"
+    assert Trip._format_time(600) == "10 min"
+    assert Trip._format_time(3599) == "59 min"
+    assert Trip._format_time(3600) == "1h 0m"
+    assert Trip._format_time(3 * 3600 + 5 * 60 + 30) == "3h 5m"
+    assert Trip._format_time(2 * 86400 + 3600 + 60) == "2d 1h 1m"
+
+
+def test_trip_vehicle_data_freshness():
+    """Tests the vehicle data freshness/liveness thresholds."""
+
+    updated_at = datetime.now().astimezone() - timedelta(seconds=30)
+    trip = Trip()
+    assert not trip.is_vehicle_data_fresh
+    assert not trip.is_vehicle_data_live
+
+    trip.mbta_vehicle = MBTAVehicle({
+        "id": "R-5480A18A",
+        "attributes": {"updated_at": updated_at.isoformat()},
+        "relationships": {"trip": {"data": None}, "stop": {"data": None}, "route": {"data": None}}
+    })
+    assert trip.is_vehicle_data_fresh
+    assert not trip.is_vehicle_data_live
+    assert trip.vehicle_status is None
+
+    # A new vehicle object is formatted again, once its stop is stored
+    trip.mbta_vehicle = MBTAVehicle({
+        "id": "R-5480A18A",
+        "attributes": {"current_status": "IN_TRANSIT_TO", "updated_at": updated_at.isoformat()},
+        "relationships": {"trip": {"data": None}, "stop": {"data": {"id": "place-alfcl"}}, "route": {"data": None}}
+    })
+    MBTAStopObjStore.clear_store()
+    assert trip.vehicle_status is None
+    MBTAStopObjStore.store(MBTAStop({"id": "place-alfcl", "attributes": {"name": "Alewife"}}))
+    assert trip.vehicle_status == "In Transit To Alewife"
+    assert trip.vehicle_stop_name == "Alewife"
+    assert trip._vehicle_stop_name_cache == ("place-alfcl", "Alewife")
+    assert trip._is_vehicle_data_live(now=updated_at + timedelta(seconds=10))
@@ -1,18 +1,82 @@
-from asyncio import sleep
+import asyncio
+import time
 from datetime import datetime
-from inspect import isdatadescriptor
+from unittest.mock import patch
+
 import pytest
-from dotenv import load_dotenv
-import os
+import pytest_asyncio
 
-from src.mbtaclient.trip import Trip
 from src.mbtaclient.client.mbta_client import MBTAClient
-from src.mbtaclient.client.mbta_cache_manager import MBTACacheManager
 from src.mbtaclient.handlers.trips_handler import TripsHandler
+from tests.helpers import check_trip, fake_fetch_data
+from tests.mock_data import handler_responses
+
 
 @pytest.mark.asyncio
+async def test_handler_offline():
+    """Tests TripsHandler end to end against canned MBTA API responses."""
+
+    async with MBTAClient() as client:
+        with patch.object(client, '_fetch_data', side_effect=fake_fetch_data(handler_responses(datetime.now().astimezone()))):
+            handler: TripsHandler = await TripsHandler.create(
+                departure_stop_name="West Natick",
+                mbta_client=client,
+                arrival_stop_name="South Station",
+                max_trips=1,
+            )
+            trips = await handler.update()
+
+    assert len(trips) == 1
+    trip = trips[0]
+    check_trip(trip, time.time(), "West Natick", "South Station")
+    assert trip.name == "518"
+    assert trip.route_name == "Framingham/Worcester Line"
+    assert trip.route_description == "Commuter Rail"
+    assert trip.departure_stop_name == "West Natick"
+    assert trip.arrival_stop_name == "South Station"
+    assert trip.arrival_platform == "Track 5"
+    # the prediction delays the departure by 2 minutes
+    assert trip.departure_delay == 120
+    assert trip.duration == 28 * 60
+    assert trip.alerts == {"DELAY: Train 518 delayed"}
+
+
+_MAX_TRIPS = 1  # Limit the number of trips to process
+
+
+async def _update_trips(mbta_client, departure_stop_name, arrival_stop_name):
+    """Create a TripsHandler for the given stops and fetch its trips."""
+    handler: TripsHandler = await TripsHandler.create(
+        departure_stop_name=departure_stop_name,
+        mbta_client=mbta_client,
+        arrival_stop_name=arrival_stop_name,
+        max_trips=_MAX_TRIPS,
+    )
+    return await handler.update()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def live_trips(request, mbta_client):
+    """
+    Start the handler update of every selected case at once on the shared client,
+    each case then awaits its own update, so its failures are reported on its own.
+    """
+    cases = {
+        (item.callspec.params["departure_stop_name"], item.callspec.params["arrival_stop_name"])
+        for item in request.session.items
+        if item.module is request.module and "live_trips" in getattr(item, "fixturenames", ())
+    }
+    tasks = {case: asyncio.create_task(_update_trips(mbta_client, *case)) for case in cases}
+    yield tasks
+    for task in tasks.values():
+        task.cancel()
+
+
+# Integration tests against the live MBTA API
+@pytest.mark.live
+@pytest.mark.asyncio(loop_scope="session")
 @pytest.mark.parametrize(
-    "departure_stop_name, arrival_stop_name,route_type",
+    "departure_stop_name, arrival_stop_name, route_type",
     [
         ("West Natick", "South Station", "Commuter Rail"),
         ("South Station", "Andrew", "Heavy Rail"),
@@ -22,80 +86,35 @@ from src.mbtaclient.handlers.trips_handler import TripsHandler
         ("Congress St @ World Trade Center Sta", "South Station", "Bus"),
     ]
 )
-async def test_handler(departure_stop_name, arrival_stop_name, route_type):
+async def test_handler(live_trips, departure_stop_name, arrival_stop_name, route_type):
     """
     Integration test for TripsHandler for different route types.
-    Ensures that trips are correctly retrieved and processed for various stops and route types.
+    Ensures that trips are correctly retrieved and processed for the given stops and route type.
+    The updates of all the cases run concurrently, started by the live_trips fixture.
 
     Args:
         departure_stop_name (str): Name of the departure stop.
         arrival_stop_name (str): Name of the arrival stop.
         route_type (str): Type of the route (e.g., train, ferry, bus).
     """
-    # Load .env file
-    load_dotenv()
-
-    # Access the token
-    API_KEY = os.getenv("API_KEY")
-    
-    # Initialize MBTA Cache Manager and Client
-    cache_manager = MBTACacheManager(requests_per_stats_report=10)
-    async with MBTAClient(cache_manager=cache_manager, api_key=API_KEY) as mbta_client:
-        
-        print(f"Testing TripsHandelr for: {departure_stop_name} {arrival_stop_name} {route_type}")
-        
-        # Configure the handler for the given stop
-        max_trips = 1  # Limit the number of trips to process
-        handler: TripsHandler = await TripsHandler.create(
-            departure_stop_name=departure_stop_name,
-            mbta_client=mbta_client,
-            arrival_stop_name=arrival_stop_name,
-            max_trips=max_trips,
+    print(f"Testing TripsHandelr for: {departure_stop_name} {arrival_stop_name} {route_type}")
+
+    # Fetch trips using the handler
+    trips = await live_trips[(departure_stop_name, arrival_stop_name)]
+    # Assertions to verify handler functionality
+    assert trips is not None, f"No trips returned for stop: {departure_stop_name} or {arrival_stop_name}"
+    assert len(trips) <= _MAX_TRIPS, f"More trips than expected for stop: {departure_stop_name} or {arrival_stop_name}"
+
+    # Loop invariant: expected route type parts
+    route_type_parts = tuple(route_type.split(" + "))
+
+    now = time.time()
+    for trip in trips:
+        check_trip(trip, now, departure_stop_name, arrival_stop_name)
+
+        # Ensure trips belong to the expected route type
+        route_description = trip.route_description
+        assert any(route_type_part in route_description for route_type_part in route_type_parts), (
+            f"Route type mismatch for stop: {departure_stop_name} or {arrival_stop_name}. "
+            f"Expected one of {route_type}, but got {route_description}."
         )
-        
-        # Fetch trips using the handler
-        trips = await handler.update()
-        trips = await handler.update()
-        # Assertions to verify handler functionality
-        assert trips is not None, f"No trips returned for stop: {departure_stop_name} or {arrival_stop_name}"
-        assert len(trips) <= max_trips, f"More trips than expected for stop: {departure_stop_name} or {arrival_stop_name}"
-        
-        for trip in trips:
-            # Validate essential trip properties
-            assert trip.mbta_route is not None, f"Trip is missing route information for {departure_stop_name} or {arrival_stop_name}"
-            assert trip.mbta_trip is not None, f"Trip is missing trip information for {departure_stop_name} or {arrival_stop_name}"
-            assert trip.departure_time is not None, f"Trip is missing departure time for {departure_stop_name} or {arrival_stop_name}"
-            
-            # Route type-specific validations
-            if trip.mbta_route.type in [1, 2]:  # Heavy Rail or Commuter Rail
-                assert trip.departure_platform is not None, (
-                    f"Rail trip at stop {departure_stop_name} must have a platform name."
-                )
-            
-            # Ensure trips belong to the expected route type
-            assert any(route_type_part in trip.route_description for route_type_part in route_type.split(" + ")), (
-                f"Route type mismatch for stop: {departure_stop_name} or {arrival_stop_name}. "
-                f"Expected one of {route_type}, but got {trip.route_description}."
-            )
-            
-            # Print trip details for debugging
-            properties = [attr for attr in dir(Trip) if isdatadescriptor(getattr(Trip, attr))]
-            for property_name in properties:
-                print(f"trip.{property_name}: {getattr(trip, property_name)}")  
-                
-            now = datetime.now().astimezone()
-
-            # Calculate time deltas
-            arrival_time = trip._departure_stop.arrival_time or trip._departure_stop.time
-            departure_time = trip._departure_stop.departure_time or trip._departure_stop.time
-
-            arrival_delta = arrival_time.astimezone() - now
-            departure_delta = departure_time.astimezone() - now
-
-            seconds_arrival = int(arrival_delta.total_seconds())
-            seconds_departure = int(departure_delta.total_seconds())
-            
-            print(f"seconds_arrival: {seconds_arrival}")
-            print(f"seconds_departure: {seconds_departure}")
-         
-            print("##############") 